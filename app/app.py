@@ -1,14 +1,22 @@
+import os
+
 import flet as ft
 
 from app.core.navigation.router import Router
 from app.core.navigation.routes import Routes
-from app.core.navigation.routes_factory import get_app_routes
+from app.core.navigation.routes_factory import get_app_routes, get_route_guards
 from app.core.state.app_state import AppState
 from app.core.theme.theme_resolver import ThemeResolver
 from app.core.layouts.app_shell import AppShell
-from app.modules.auth.controller.auth_controller import AuthController
 from app.shared.components.dialogs.dialog_dispatcher import Dialogs
 from app.shared.components.dialogs.dialog_queue import DialogQueue
+from app.shared.components.dialogs.toast_channel import get_toasts
+from app.shared.services.http_client import get_http_client
+from app.shared.services.http_metrics import export_at_exit
+from app.shared.services.http_policy import CircuitState
+from app.shared.services.storange_service import get_storage
+from app.shared.services.token_manager import get_token_manager
+from app.core.utils.update_scheduler import UpdateScheduler
 
 
 def create_app(page: ft.Page) -> None:
@@ -24,6 +32,11 @@ def create_app(page: ft.Page) -> None:
 
     page.on_login = None
 
+    # ─────────────────────────────
+    # Atualizações (um envio por tick)
+    # ─────────────────────────────
+    page.update_scheduler = UpdateScheduler(page)
+
     # ─────────────────────────────
     # Estado global
     # ─────────────────────────────
@@ -34,10 +47,15 @@ def create_app(page: ft.Page) -> None:
     # ─────────────────────────────
     def on_theme_change():
         ThemeResolver.apply(app_state, page)
-        page.bgcolor = page.theme.color_scheme.background
-        page.update()
 
-    app_state.subscribe(on_theme_change)
+    def on_platform_brightness_change(e):
+        # No modo do sistema o Flutter troca o tema sozinho; só o fundo e os
+        # controles com cores próprias precisam do novo esquema
+        if page.theme_mode == ft.ThemeMode.SYSTEM:
+            ThemeResolver.sync_scheme(page)
+
+    app_state.subscribe(on_theme_change, "theme_mode")
+    page.on_platform_brightness_change = on_platform_brightness_change
     ThemeResolver.apply(app_state, page)
 
     # ─────────────────────────────
@@ -45,6 +63,41 @@ def create_app(page: ft.Page) -> None:
     # ─────────────────────────────
     page.dialog_queue = DialogQueue(page)
 
+    # ─────────────────────────────
+    # HTTP (pool de conexões da sessão)
+    # ─────────────────────────────
+    http_client = get_http_client(page)
+
+    # Métricas são do processo: um único export no encerramento, não por sessão
+    metrics_file = os.environ.get("VIMI42_HTTP_METRICS_FILE")
+    if metrics_file:
+        export_at_exit(metrics_file, http_client.metrics)
+
+    # ─────────────────────────────
+    # Storage (namespace hidratado com uma única leitura) e token
+    # ─────────────────────────────
+    get_storage(page)
+    token_manager = get_token_manager(page)
+
+    # ─────────────────────────────
+    # Fim da sessão
+    # ─────────────────────────────
+    async def on_session_close(_):
+        token_manager.close()
+        get_toasts(page).close()
+        await http_client.aclose()
+
+    page.on_close = on_session_close
+
+    def on_circuit_change(state: CircuitState):
+        if state == CircuitState.OPEN:
+            Dialogs.warning(
+                page,
+                "Nossos servidores estão instáveis. Vamos tentar novamente em instantes.",
+            )
+
+    http_client.circuit_breaker.subscribe(on_circuit_change)
+
     # ─────────────────────────────
     # Shell
     # ─────────────────────────────
@@ -55,7 +108,7 @@ def create_app(page: ft.Page) -> None:
     # Rotas / Views
     # ─────────────────────────────
     routes = get_app_routes()
-    Router(page, routes, shell)
+    Router(page, routes, shell, guards=get_route_guards())
 
     # ─────────────────────────────
     # Rota inicial
@@ -5,6 +5,7 @@ from app.core.errors.exceptions import (
     NotFoundError,
     UnprocessableEntityError,
     ServerError,
+    ServiceUnavailableError,
     ValidationError,
     ConflictError,
 )
@@ -28,6 +29,9 @@ def map_auth_error(exc: Exception) -> str:
     if isinstance(exc, NetworkError):
         return "Erro de conexão. Verifique sua internet."
 
+    if isinstance(exc, ServiceUnavailableError):
+        return "O sistema está instável no momento. Aguarde alguns instantes e tente novamente."
+
     if isinstance(exc, ServerError):
         return "O sistema está temporariamente indisponível."
 
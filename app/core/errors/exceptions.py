@@ -26,6 +26,10 @@ class ServerError(AppException):
     pass
 
 
+class ServiceUnavailableError(ServerError):
+    """Circuit breaker aberto: o backend não é chamado até se recuperar"""
+
+
 class ValidationError(AppException):
     pass
 
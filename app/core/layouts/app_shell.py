@@ -1,5 +1,6 @@
 import flet as ft
 from app.shared.components.navigation.bottom_navbar import CustomBottomNavbar
+from app.core.utils.update_scheduler import request_update
 
 class AppShell(ft.Container):
     def __init__(self, page: ft.Page):
@@ -14,6 +15,7 @@ class AppShell(ft.Container):
         
         self.navbar = CustomBottomNavbar(page)
         self.navbar.visible = False
+        self._centered: bool | None = None
 
         self.scroll_container = ft.Container(
             content=self.scroll_area,
@@ -31,27 +33,46 @@ class AppShell(ft.Container):
         )
 
     def set_content(self, control: ft.Control, show_nav: bool = False, centered: bool = False):
-        self.scroll_area.controls.clear()
-        self.scroll_area.controls.append(control)
-        
-        if centered:
-            self.scroll_area.alignment = ft.MainAxisAlignment.CENTER
-            self.scroll_container.alignment = ft.alignment.center
-        else:
-            self.scroll_area.alignment = ft.MainAxisAlignment.START
-            self.scroll_container.alignment = ft.alignment.top_center
-        
-        try:
-            self.scroll_area.scroll_to(offset=0, duration=100)
-        except Exception:
-            pass
-            
+        # Só o que mudou é marcado: a navegação inteira sai em um único envio
+        dirty: list[ft.Control] = []
+
+        content_changed = self.scroll_area.controls != [control]
+        if content_changed:
+            self.scroll_area.controls.clear()
+            self.scroll_area.controls.append(control)
+
+        if centered != self._centered:
+            self._centered = centered
+            if centered:
+                self.scroll_area.alignment = ft.MainAxisAlignment.CENTER
+                self.scroll_container.alignment = ft.alignment.center
+            else:
+                self.scroll_area.alignment = ft.MainAxisAlignment.START
+                self.scroll_container.alignment = ft.alignment.top_center
+            # O container já leva a coluna (e o conteúdo novo) junto
+            dirty.append(self.scroll_container)
+        elif content_changed:
+            dirty.append(self.scroll_area)
+
+        if content_changed and self.scroll_area.page is not None:
+            try:
+                self.scroll_area.scroll_to(offset=0, duration=100)
+            except Exception:
+                pass
+
+        nav_changed = self.navbar.visible != show_nav
         self.navbar.visible = show_nav
         if show_nav:
-            self.navbar.update_state()
+            nav_changed = self.navbar.update_state() or nav_changed
+        if nav_changed:
+            dirty.append(self.navbar)
+
+        if self.content.page is None:
+            # Shell ainda não montado: o page.add() envia tudo de uma vez
+            return
+        for changed in dirty:
+            request_update(changed)
 
-        self.update()
-        
     def refresh(self) -> None:
         if not self.page or not self.page.views:
             return
@@ -61,12 +82,12 @@ class AppShell(ft.Container):
         for control in current_view.controls:
             self.scroll_area.controls.append(control)
 
-        self.update()
+        request_update(self)
 
     def fade_out(self):
         self.opacity = 0.0
-        self.update()
+        request_update(self)
 
     def fade_in(self):
         self.opacity = 1.0
-        self.update()
\ No newline at end of file
+        request_update(self)
\ No newline at end of file
@@ -0,0 +1,23 @@
+import time
+from typing import Callable
+
+import flet as ft
+
+from app.core.navigation.route_matcher import RouteMatch
+from app.core.navigation.routes import Routes
+from app.shared.services.token_manager import get_token_manager
+
+# Recebe a página e o match; devolve a rota de redirecionamento ou None para seguir
+Guard = Callable[[ft.Page, RouteMatch], str | None]
+
+
+def requires_auth(page: ft.Page, match: RouteMatch) -> str | None:
+    tokens = get_token_manager(page)
+    if not tokens.token:
+        return Routes.LOGIN
+
+    expires_at = tokens.expires_at
+    if expires_at is not None and expires_at <= time.time():
+        return Routes.LOGIN
+
+    return None
@@ -0,0 +1,60 @@
+import importlib
+import threading
+from typing import Callable, Iterable
+
+import flet as ft
+
+ViewFactory = Callable[..., ft.Control]
+
+
+class LazyRoute:
+    """Factory de view importada só na primeira visita à rota.
+
+    `target` é uma string "pacote.modulo:funcao" ou um loader sem argumentos
+    que devolve a factory.
+    """
+
+    def __init__(self, target: str | Callable[[], ViewFactory]):
+        self.target = target
+        self._factory: ViewFactory | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._factory is not None
+
+    def load(self) -> ViewFactory:
+        if self._factory is None:
+            with self._lock:
+                if self._factory is None:
+                    self._factory = self._resolve()
+        return self._factory
+
+    def _resolve(self) -> ViewFactory:
+        if callable(self.target):
+            return self.target()
+        module_name, _, attr = self.target.partition(":")
+        return getattr(importlib.import_module(module_name), attr)
+
+    def prefetch(self, page: ft.Page) -> None:
+        """Executa o `prefetch(page)` do módulo da página, se existir (carregar dados antes da visita)."""
+        if callable(self.target):
+            return
+        module = importlib.import_module(self.target.partition(":")[0])
+        hook = getattr(module, "prefetch", None)
+        if callable(hook):
+            hook(page)
+
+    def __call__(self, page: ft.Page, *args, **kwargs) -> ft.Control:
+        return self.load()(page, *args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyRoute({self.target!r})"
+
+
+def warm_up(routes: dict[str, Callable], names: Iterable[str]) -> None:
+    """Importa antecipadamente os módulos das rotas informadas (chamar fora da thread de UI)."""
+    for name in names:
+        route = routes.get(name)
+        if isinstance(route, LazyRoute) and not route.loaded:
+            route.load()
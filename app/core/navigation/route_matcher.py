@@ -0,0 +1,99 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+from urllib.parse import parse_qsl, urlsplit
+
+CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "str": str,
+    "int": int,
+}
+
+PARAM_RE = re.compile(r"^:(?P<name>[A-Za-z_]\w*)(?:<(?P<type>\w+)>)?$")
+
+
+@dataclass(frozen=True)
+class RouteMatch:
+    pattern: str
+    path: str
+    params: dict[str, Any] = field(default_factory=dict)
+    query: dict[str, str] = field(default_factory=dict)
+
+
+class _Node:
+    __slots__ = ("static", "param", "pattern")
+
+    def __init__(self):
+        self.static: dict[str, _Node] = {}
+        self.param: tuple[str, Callable[[str], Any], _Node] | None = None
+        self.pattern: str | None = None
+
+
+def _segments(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+class RouteMatcher:
+    """Trie de segmentos compilada uma vez: `/listing/:id<int>`, `/reset-password/:token`.
+
+    Segmentos estáticos têm prioridade sobre parâmetros no mesmo nível.
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self._root = _Node()
+        for pattern in patterns:
+            self.add(pattern)
+
+    def add(self, pattern: str) -> None:
+        node = self._root
+        for segment in _segments(pattern):
+            param = PARAM_RE.match(segment)
+            if param is None:
+                node = node.static.setdefault(segment, _Node())
+                continue
+
+            name = param.group("name")
+            converter = CONVERTERS[param.group("type") or "str"]
+            if node.param is None:
+                node.param = (name, converter, _Node())
+            elif node.param[0] != name:
+                raise ValueError(f"Parâmetro conflitante em {pattern}: {name} x {node.param[0]}")
+            node = node.param[2]
+
+        node.pattern = pattern
+
+    def match(self, route: str) -> RouteMatch | None:
+        parts = urlsplit(route)
+        params: dict[str, Any] = {}
+        pattern = self._walk(self._root, _segments(parts.path), 0, params)
+        if pattern is None:
+            return None
+        return RouteMatch(
+            pattern=pattern,
+            path=parts.path or "/",
+            params=params,
+            query=dict(parse_qsl(parts.query)),
+        )
+
+    def _walk(self, node: _Node, segments: list[str], index: int, params: dict) -> str | None:
+        if index == len(segments):
+            return node.pattern
+
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            found = self._walk(child, segments, index + 1, params)
+            if found is not None:
+                return found
+
+        if node.param is not None:
+            name, converter, child = node.param
+            try:
+                value = converter(segment)
+            except ValueError:
+                return None
+            found = self._walk(child, segments, index + 1, params)
+            if found is not None:
+                params[name] = value
+                return found
+
+        return None
@@ -0,0 +1,32 @@
+import threading
+from collections import Counter, defaultdict
+
+
+class RoutePredictor:
+    """Prevê a próxima rota: tabela configurada até haver navegações suficientes para aprender."""
+
+    def __init__(self, transitions: dict[str, list[str]] | None = None, *, min_samples: int = 20):
+        self.transitions = dict(transitions or {})
+        self.min_samples = min_samples
+        self._counts: dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def record(self, from_route: str | None, to_route: str) -> None:
+        if not from_route or from_route == to_route:
+            return
+        with self._lock:
+            self._counts[from_route][to_route] += 1
+
+    def predict(self, route: str) -> list[str]:
+        """Rotas candidatas, da mais provável para a menos provável."""
+        ranked: list[str] = []
+        with self._lock:
+            counts = self._counts.get(route)
+            if counts and sum(counts.values()) >= self.min_samples:
+                ranked = [candidate for candidate, _ in counts.most_common()]
+
+        # A tabela configurada completa o ranking com o que ainda não foi visto
+        for candidate in self.transitions.get(route, ()):
+            if candidate not in ranked:
+                ranked.append(candidate)
+        return ranked
@@ -1,31 +1,174 @@
+import threading
+
 import flet as ft
 from typing import Dict, Callable
 from app.core.layouts.app_shell import AppShell
+from app.core.navigation.guards import Guard
+from app.core.navigation.lazy_route import warm_up
+from app.core.navigation.route_matcher import RouteMatch, RouteMatcher
+from app.core.navigation.route_predictor import RoutePredictor
 from app.core.navigation.routes import Routes
+from app.core.navigation.view_cache import ViewCache
+from app.core.utils.update_scheduler import batch
+
+
+# Transições aprendidas com a navegação de todas as sessões do processo
+shared_predictor = RoutePredictor(Routes.LIKELY_NEXT)
 
 
 class Router:
-    def __init__(self, page: ft.Page, routes: Dict[str, Callable], shell: AppShell):
+    def __init__(
+        self,
+        page: ft.Page,
+        routes: Dict[str, Callable],
+        shell: AppShell,
+        *,
+        cached_routes: list[str] | None = None,
+        cache_size: int = 4,
+        warm_up_next: bool = True,
+        predictor: RoutePredictor | None = None,
+        guards: dict[str, list[Guard]] | None = None,
+    ):
         self.page = page
         self.routes = routes
+        self.matcher = RouteMatcher(routes)
+        self.guards = guards or {}
         self.shell = shell
-        
+        self.cached_routes = set(Routes.CACHED_ROUTES if cached_routes is None else cached_routes)
+        self.view_cache = ViewCache(cache_size)
+        self.warm_up_next = warm_up_next
+        self.predictor = predictor or shared_predictor
+        self._current_route: str | None = None
+        self._prebuilt: tuple[str, ft.Control] | None = None
+        self._prebuild_lock = threading.Lock()
+        # Incrementado a cada invalidate_all: pré-montagens em andamento são descartadas
+        self._generation = 0
+
+        self.page.router = self
         self.page.on_route_change = self._on_route_change
 
+    def invalidate(self, path: str) -> None:
+        """Descarta a view em cache (e a pré-montada) da rota: a próxima visita monta do zero."""
+        self.view_cache.invalidate(path)
+        with self._prebuild_lock:
+            if self._prebuilt and self._prebuilt[0] == path:
+                self._prebuilt = None
+
+    def invalidate_all(self) -> None:
+        """Descarta todas as views em cache e a pré-montada (ex.: o esquema de cores mudou)."""
+        self.view_cache.clear()
+        with self._prebuild_lock:
+            self._generation += 1
+            self._prebuilt = None
+
     def _on_route_change(self, e: ft.RouteChangeEvent) -> None:
-        view_factory = self.routes.get(e.route) or self.routes.get(Routes.DEFAULT)
-        content = view_factory(self.page)
-        
-        is_main_route = e.route in Routes.MAIN_NAV_ROUTES
+        match = self.matcher.match(e.route) or self.matcher.match(Routes.DEFAULT)
+
+        # Guards rodam antes da factory: nada é montado para rotas bloqueadas
+        redirect = self._run_guards(match)
+        if redirect is not None:
+            self.page.go(redirect)
+            return
+
+        self.page.route_match = match
+        self.predictor.record(self._current_route, match.pattern)
+        self._current_route = match.pattern
+
+        is_main_route = match.pattern in Routes.MAIN_NAV_ROUTES
 
         should_center = not is_main_route
 
-        self.shell.set_content(
-            content, 
-            show_nav=is_main_route, 
-            centered=should_center
-        )
-        self.page.update()
+        # Montagem da view + shell saem em um único envio
+        with batch(self.page):
+            content = self._build_view(match)
+            self.shell.set_content(
+                content, 
+                show_nav=is_main_route, 
+                centered=should_center
+            )
+
+        if self.warm_up_next:
+            self._warm_up(match.pattern)
+
+        self._schedule_prebuild(match.pattern)
+
+    def _run_guards(self, match: RouteMatch) -> str | None:
+        for guard in self.guards.get(match.pattern, ()):
+            redirect = guard(self.page, match)
+            if redirect is not None and redirect != match.path:
+                return redirect
+        return None
+
+    def _warm_up(self, route: str) -> None:
+        # Depois da pintura: importa em segundo plano as rotas prováveis seguintes
+        likely = Routes.LIKELY_NEXT.get(route)
+        if likely:
+            self.page.run_thread(warm_up, self.routes, likely)
+
+    def _build_view(self, match: RouteMatch) -> ft.Control:
+        cacheable = match.pattern in self.cached_routes
+
+        if cacheable:
+            cached = self.view_cache.get(match.path)
+            if cached is not None:
+                return cached
+
+        content = None if match.params else self._take_prebuilt(match.pattern)
+        if content is None:
+            content = self.routes[match.pattern](self.page, **match.params)
+
+        if cacheable:
+            self.view_cache.put(match.path, content)
+        return content
+
+    # ─────────────────────────────
+    # PREBUILD (próxima rota provável)
+    # ─────────────────────────────
+
+    def _schedule_prebuild(self, route: str) -> None:
+        # Primeira candidata que pode ser montada e ainda não está no cache
+        for next_route in self.predictor.predict(route):
+            if not self._can_prebuild(next_route):
+                continue
+            if next_route in self.cached_routes and self.view_cache.get(next_route) is not None:
+                continue
+            break
+        else:
+            return
+
+        with self._prebuild_lock:
+            if self._prebuilt and self._prebuilt[0] == next_route:
+                return
+
+        # Monta a view enquanto o usuário ainda está na página atual
+        self.page.run_thread(self._prebuild, next_route)
+
+    def _can_prebuild(self, route: str) -> bool:
+        # Rotas com parâmetros dependem da navegação real; rotas com guards só
+        # são montadas depois que os guards liberam a navegação
+        return route in self.routes and ":" not in route and not self.guards.get(route)
+
+    def _prebuild(self, route: str) -> None:
+        factory = self.routes[route]
+        generation = self._generation
+        try:
+            if hasattr(factory, "prefetch"):
+                factory.prefetch(self.page)
+            view = factory(self.page)
+        except Exception:
+            return  # a navegação real monta a view normalmente
+
+        with self._prebuild_lock:
+            if generation == self._generation:
+                self._prebuilt = (route, view)
+
+    def _take_prebuilt(self, route: str) -> ft.Control | None:
+        with self._prebuild_lock:
+            if self._prebuilt is None or self._prebuilt[0] != route:
+                return None
+            _, view = self._prebuilt
+            self._prebuilt = None
+            return view
 
     def _notify_shells(self):
         for control in self.page.controls:
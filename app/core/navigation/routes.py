@@ -10,6 +10,7 @@ class Routes:
     FORGOT_PASSWORD = "/forgot-password"
     RESET_PASSWORD_TOKEN = "/reset-password/token"
     RESET_PASSWORD_NEW = "/reset-password/new"
+    RESET_PASSWORD_LINK = "/reset-password/:token"  # Link do e-mail com o token
 
     # ─────────────────────────────
     # DEFAULT
@@ -27,4 +28,22 @@ class Routes:
     # BOTTOM NAVIBAR
     # ─────────────────────────────
 
-    MAIN_NAV_ROUTES = [HOME]
\ No newline at end of file
+    MAIN_NAV_ROUTES = [HOME]
+
+    # ─────────────────────────────
+    # VIEW CACHE (views reaproveitadas ao voltar)
+    # ─────────────────────────────
+
+    CACHED_ROUTES = [LOGIN, REGISTER, FORGOT_PASSWORD]
+
+    # ─────────────────────────────
+    # PRÓXIMAS ROTAS PROVÁVEIS (warm-up)
+    # ─────────────────────────────
+
+    LIKELY_NEXT = {
+        LOGIN: [HOME, REGISTER, FORGOT_PASSWORD],
+        REGISTER: [LOGIN],
+        FORGOT_PASSWORD: [RESET_PASSWORD_TOKEN],
+        RESET_PASSWORD_TOKEN: [RESET_PASSWORD_NEW],
+        RESET_PASSWORD_NEW: [LOGIN],
+    }
@@ -0,0 +1,44 @@
+from collections import OrderedDict
+from typing import Callable
+
+import flet as ft
+
+EvictHook = Callable[[str, ft.Control], None]
+
+
+class ViewCache:
+    """LRU das views já montadas, para reaproveitar controles (e seu estado) ao voltar a uma rota."""
+
+    def __init__(self, max_size: int = 4):
+        self.max_size = max_size
+        self._views: OrderedDict[str, ft.Control] = OrderedDict()
+        self._evict_hooks: list[EvictHook] = []
+
+    def on_evict(self, hook: EvictHook) -> None:
+        self._evict_hooks.append(hook)
+
+    def get(self, route: str) -> ft.Control | None:
+        view = self._views.get(route)
+        if view is not None:
+            self._views.move_to_end(route)
+        return view
+
+    def put(self, route: str, view: ft.Control) -> None:
+        self._views[route] = view
+        self._views.move_to_end(route)
+        while len(self._views) > self.max_size:
+            evicted_route, evicted_view = self._views.popitem(last=False)
+            self._evicted(evicted_route, evicted_view)
+
+    def invalidate(self, route: str) -> None:
+        view = self._views.pop(route, None)
+        if view is not None:
+            self._evicted(route, view)
+
+    def clear(self) -> None:
+        for route in list(self._views):
+            self.invalidate(route)
+
+    def _evicted(self, route: str, view: ft.Control) -> None:
+        for hook in self._evict_hooks:
+            hook(route, view)
@@ -1,19 +1,106 @@
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Callable
+
 from app.core.theme.theme_mode import ThemeMode
 
+Listener = Callable[[], None]
+
+
+class Subscription:
+    """Handle devolvido por `AppState.subscribe`; `unsubscribe()` remove o listener."""
+
+    def __init__(self, state: "AppState", key: str | None, ref: Callable[[], Listener | None]):
+        self._state = state
+        self.key = key
+        self._ref = ref
+
+    @property
+    def callback(self) -> Listener | None:
+        return self._ref()
+
+    @property
+    def active(self) -> bool:
+        return self._ref() is not None and self in self._state._listeners.get(self.key, ())
+
+    def unsubscribe(self) -> None:
+        self._state._remove(self)
+
 
 class AppState:
     def __init__(self):
         self.theme_mode: ThemeMode = ThemeMode.SYSTEM
-        self._listeners: list[callable] = []
+        # Chave None = interessado em qualquer mudança
+        self._listeners: dict[str | None, list[Subscription]] = {}
+        self._lock = threading.RLock()
+        self._transaction_depth = 0
+        self._pending: set[str] = set()
 
     def set_theme_mode(self, mode: ThemeMode) -> None:
         if self.theme_mode != mode:
             self.theme_mode = mode
-            self._notify()
+            self._changed("theme_mode")
+
+    def subscribe(self, callback: Listener, key: str | None = None, *, weak: bool = False) -> Subscription:
+        """Registra `callback` para mudanças em `key` (ou em qualquer chave, se None).
+
+        Métodos de instância são sempre guardados por referência fraca, para não
+        manter views destruídas vivas; funções comuns só quando `weak=True`.
+        """
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            ref = weakref.WeakMethod(callback)
+        elif weak:
+            ref = weakref.ref(callback)
+        else:
+            ref = lambda: callback  # noqa: E731
+
+        subscription = Subscription(self, key, ref)
+        with self._lock:
+            self._listeners.setdefault(key, []).append(subscription)
+        return subscription
+
+    @contextmanager
+    def transaction(self):
+        """Agrupa várias mutações: cada listener é chamado no máximo uma vez ao final."""
+        with self._lock:
+            self._transaction_depth += 1
+        try:
+            yield self
+        finally:
+            changed: set[str] = set()
+            with self._lock:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0:
+                    changed, self._pending = self._pending, set()
+            if changed:
+                self._notify(changed)
+
+    def _changed(self, key: str) -> None:
+        with self._lock:
+            if self._transaction_depth > 0:
+                self._pending.add(key)
+                return
+        self._notify({key})
+
+    def _notify(self, keys: set[str]) -> None:
+        with self._lock:
+            subscriptions = list(self._listeners.get(None, ()))
+            for key in keys:
+                subscriptions.extend(self._listeners.get(key, ()))
 
-    def subscribe(self, callback: callable) -> None:
-        self._listeners.append(callback)
+        for subscription in subscriptions:
+            callback = subscription.callback
+            if callback is None:
+                # Dono já coletado: limpa a assinatura morta
+                self._remove(subscription)
+                continue
+            callback()
 
-    def _notify(self) -> None:
-        for callback in self._listeners:
-            callback()
\ No newline at end of file
+    def _remove(self, subscription: Subscription) -> None:
+        with self._lock:
+            listeners = self._listeners.get(subscription.key)
+            if listeners and subscription in listeners:
+                listeners.remove(subscription)
+                if not listeners:
+                    del self._listeners[subscription.key]
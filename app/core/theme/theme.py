@@ -1,8 +1,22 @@
+from functools import cache
+
 import flet as ft
 from app.core.theme import colors
 
 
 class AppTheme:
+    """Temas do app. `light()`/`dark()` são construídos uma vez por processo e
+    compartilhados por todas as sessões (não devem ser mutados)."""
+
+    @staticmethod
+    @cache
+    def light() -> ft.Theme:
+        return AppTheme.build_light_theme()
+
+    @staticmethod
+    @cache
+    def dark() -> ft.Theme:
+        return AppTheme.build_dark_theme()
 
     @staticmethod
     def build_light_theme() -> ft.Theme:
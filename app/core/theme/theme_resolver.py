@@ -2,28 +2,58 @@ import flet as ft
 from app.core.theme.theme import AppTheme
 from app.core.theme.theme_mode import ThemeMode
 from app.core.state.app_state import AppState
+from app.core.theme.themeable_registry import get_themeable_registry
+from app.core.utils.update_scheduler import request_update
 
 class ThemeResolver:
 
     @staticmethod
     def apply(app_state: AppState, page: ft.Page) -> None:
-        page.theme = AppTheme.build_light_theme()
-        page.dark_theme = AppTheme.build_dark_theme()
+        page_changed = False
+
+        # Temas compartilhados pelo processo: atribuídos uma única vez por sessão
+        if page.theme is not AppTheme.light() or page.dark_theme is not AppTheme.dark():
+            page.theme = AppTheme.light()
+            page.dark_theme = AppTheme.dark()
+            page_changed = True
 
         if app_state.theme_mode == ThemeMode.LIGHT:
-            page.theme_mode = ft.ThemeMode.LIGHT
+            theme_mode = ft.ThemeMode.LIGHT
         elif app_state.theme_mode == ThemeMode.DARK:
-            page.theme_mode = ft.ThemeMode.DARK
+            theme_mode = ft.ThemeMode.DARK
         else:
-            page.theme_mode = ft.ThemeMode.SYSTEM
+            theme_mode = ft.ThemeMode.SYSTEM
+
+        if page.theme_mode != theme_mode:
+            page.theme_mode = theme_mode
+            page_changed = True
+
+        ThemeResolver.sync_scheme(page, page_changed=page_changed)
+
+    @staticmethod
+    def sync_scheme(page: ft.Page, *, page_changed: bool = False) -> None:
+        """Envia o esquema efetivo só aos controles temáveis montados, se ele mudou.
 
+        A página só é marcada quando uma propriedade dela mudou (tema, modo ou
+        fundo); senão os updates ficam restritos aos controles.
+        """
         effective_scheme = ThemeResolver.get_scheme(page)
+        if page.bgcolor != effective_scheme.background:
+            page.bgcolor = effective_scheme.background
+            page_changed = True
 
-        for view in page.views:
-            if hasattr(view, "on_theme_change") and callable(view.on_theme_change):
-                view.on_theme_change(effective_scheme)
+        registry = get_themeable_registry(page)
+        if effective_scheme is not registry.scheme:
+            if registry.scheme is not None:
+                # Views em cache/pré-montadas têm cores fixadas na montagem fora
+                # dos controles temáveis: a próxima visita monta com o esquema novo
+                router = getattr(page, "router", None)
+                if router is not None:
+                    router.invalidate_all()
+            registry.apply(effective_scheme)
 
-        page.update()
+        if page_changed:
+            request_update(page)
 
     @staticmethod
     def get_scheme(page: ft.Page) -> ft.ColorScheme:
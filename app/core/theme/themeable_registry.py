@@ -0,0 +1,75 @@
+import threading
+import weakref
+
+import flet as ft
+
+
+class ThemeableRegistry:
+    """Controles montados que reagem à troca de tema (`update_theme(scheme)`).
+
+    Guarda só referências fracas e é mantido pelo ciclo de vida do controle
+    (did_mount / will_unmount): a troca de tema percorre apenas os k controles
+    atualmente na tela.
+    """
+
+    def __init__(self):
+        self._controls: weakref.WeakValueDictionary[int, ft.Control] = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self.scheme: ft.ColorScheme | None = None
+
+    def register(self, control: ft.Control) -> None:
+        with self._lock:
+            self._controls[id(control)] = control
+
+    def unregister(self, control: ft.Control) -> None:
+        with self._lock:
+            if self._controls.get(id(control)) is control:
+                del self._controls[id(control)]
+
+    def controls(self) -> list[ft.Control]:
+        with self._lock:
+            return list(self._controls.values())
+
+    def __len__(self) -> int:
+        return len(self._controls)
+
+    def apply(self, scheme: ft.ColorScheme) -> None:
+        self.scheme = scheme
+        for control in self.controls():
+            control.update_theme(scheme)
+
+
+def get_themeable_registry(page: ft.Page) -> ThemeableRegistry:
+    registry = getattr(page, "themeable_registry", None)
+    if registry is None:
+        registry = ThemeableRegistry()
+        page.themeable_registry = registry
+    return registry
+
+
+class Themeable:
+    """Mixin para controles com `update_theme(scheme)` e o esquema atual em `_scheme`.
+
+    Entra no registro da página ao montar e sai ao desmontar; se o tema mudou
+    enquanto estava fora da tela (ex.: view em cache), reaplica ao voltar.
+    """
+
+    _scheme: ft.ColorScheme | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Falha na definição da classe, não na primeira troca de tema
+        if not callable(getattr(cls, "update_theme", None)):
+            raise TypeError(f"{cls.__name__} precisa implementar update_theme(scheme)")
+
+    def did_mount(self):
+        super().did_mount()
+        registry = get_themeable_registry(self.page)
+        registry.register(self)
+        if registry.scheme is not None and registry.scheme is not self._scheme:
+            self.update_theme(registry.scheme)
+
+    def will_unmount(self):
+        if self.page is not None:
+            get_themeable_registry(self.page).unregister(self)
+        super().will_unmount()
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from functools import cache
+
+import flet as ft
+
+from app.core.theme.theme import AppTheme
+
+# =========================
+# INDEPENDENTES DO MODO
+# =========================
+# Instâncias compartilhadas por todos os controles: não devem ser mutadas.
+
+animation_fast = ft.Animation(300, ft.AnimationCurve.DECELERATE)
+animation_slow = ft.Animation(600, ft.AnimationCurve.DECELERATE)
+
+navbar_shadow = ft.BoxShadow(
+    spread_radius=1,
+    blur_radius=10,
+    color=ft.Colors.with_opacity(0.05, ft.Colors.BLACK),
+    offset=ft.Offset(0, -2),
+)
+
+
+# =========================
+# POR MODO (CLARO / ESCURO)
+# =========================
+
+@dataclass(frozen=True)
+class ThemeTokens:
+    scheme: ft.ColorScheme
+
+    # Cores derivadas (alpha)
+    border_subtle: str
+    hint: str
+
+    # Campos de texto
+    input_text: ft.TextStyle
+    input_label: ft.TextStyle
+    input_floating_label: ft.TextStyle
+    input_hint: ft.TextStyle
+    input_error: ft.TextStyle
+
+    # Regras de senha
+    rule_valid: str
+    rule_invalid: str
+
+
+def build_tokens(scheme: ft.ColorScheme) -> ThemeTokens:
+    hint = scheme.on_surface_variant + "AA"
+    return ThemeTokens(
+        scheme=scheme,
+        border_subtle=scheme.outline + "88",
+        hint=hint,
+        input_text=ft.TextStyle(color=scheme.on_surface_variant),
+        input_label=ft.TextStyle(color=scheme.on_surface_variant),
+        input_floating_label=ft.TextStyle(color=scheme.primary),
+        input_hint=ft.TextStyle(color=hint),
+        input_error=ft.TextStyle(color=scheme.error),
+        rule_valid=scheme.secondary,
+        rule_invalid=scheme.outline,
+    )
+
+
+@cache
+def light_tokens() -> ThemeTokens:
+    return build_tokens(AppTheme.light().color_scheme)
+
+
+@cache
+def dark_tokens() -> ThemeTokens:
+    return build_tokens(AppTheme.dark().color_scheme)
+
+
+def tokens_for(scheme: ft.ColorScheme) -> ThemeTokens:
+    """Tabela do esquema: as dos temas do app saem prontas; esquemas avulsos são montados na hora."""
+    if scheme is AppTheme.light().color_scheme:
+        return light_tokens()
+    if scheme is AppTheme.dark().color_scheme:
+        return dark_tokens()
+    return build_tokens(scheme)
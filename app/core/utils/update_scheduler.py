@@ -0,0 +1,91 @@
+import threading
+from contextlib import contextmanager, nullcontext
+
+import flet as ft
+
+
+class UpdateScheduler:
+    """Junta os update() de uma sessão em um único envio por tick do event loop.
+
+    Controles marcados como sujos são enviados juntos em `page.update(*controls)`;
+    se a página inteira foi marcada, um único `page.update()` cobre tudo.
+    """
+
+    def __init__(self, page: ft.Page):
+        self.page = page
+        self._dirty: dict[int, ft.Control] = {}
+        self._page_dirty = False
+        self._batch_depth = 0
+        self._flush_scheduled = False
+        self._lock = threading.RLock()
+
+    def mark_dirty(self, control: ft.Control | None = None) -> None:
+        with self._lock:
+            if control is None or control is self.page:
+                self._page_dirty = True
+            else:
+                self._dirty[id(control)] = control
+
+            if self._batch_depth == 0 and not self._flush_scheduled:
+                self._schedule_flush()
+
+    @contextmanager
+    def batch(self):
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                should_flush = self._batch_depth == 0
+            if should_flush:
+                self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_scheduled = False
+            # Flush agendado antes de um batch (outra thread) não envia estado
+            # pela metade: a saída do batch envia tudo de uma vez
+            if self._batch_depth > 0:
+                return
+            page_dirty, self._page_dirty = self._page_dirty, False
+            controls, self._dirty = list(self._dirty.values()), {}
+
+        if page_dirty:
+            self.page.update()
+            return
+
+        # Controles desmontados entre a marcação e o flush não são enviados
+        mounted = [control for control in controls if control.page is not None]
+        if mounted:
+            self.page.update(*mounted)
+
+    def _schedule_flush(self) -> None:
+        loop = getattr(self.page, "loop", None)
+        if loop is None or not loop.is_running():
+            self.flush()
+            return
+
+        self._flush_scheduled = True
+        loop.call_soon_threadsafe(self.flush)
+
+
+def get_update_scheduler(page: ft.Page | None) -> UpdateScheduler | None:
+    return getattr(page, "update_scheduler", None) if page is not None else None
+
+
+def request_update(control: ft.Control) -> None:
+    """Agenda o update do controle no scheduler da sessão (ou atualiza na hora, sem scheduler)."""
+    page = control if isinstance(control, ft.Page) else control.page
+    scheduler = get_update_scheduler(page)
+    if scheduler is None:
+        control.update()
+        return
+    scheduler.mark_dirty(control)
+
+
+def batch(page: ft.Page | None):
+    """`with batch(page):` agrupa as atualizações do bloco em um único envio."""
+    scheduler = get_update_scheduler(page)
+    return scheduler.batch() if scheduler is not None else nullcontext()
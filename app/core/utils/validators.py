@@ -51,5 +51,8 @@ class InputFormatters:
         else:
             formatted = e.control.value
 
+        # Import local: o módulo de validadores não depende de flet
+        from app.core.utils.update_scheduler import request_update
+
         e.control.value = formatted
-        e.control.update()
\ No newline at end of file
+        request_update(e.control)
\ No newline at end of file
@@ -1,16 +1,56 @@
-import re
+import hashlib
+import json
+import time
+import uuid
 from app.core.errors.exceptions import ConflictError, NotFoundError, UnprocessableEntityError
 from app.core.navigation.routes import Routes
 from app.modules.auth.domain.auth_validations import AuthValidations
+from app.modules.auth.domain.document_batch import digits_only
+from app.modules.auth.domain.password_rules import PasswordRuleEvaluator
 from app.modules.auth.services.auth_service import AuthService
 from app.core.errors.error_mapper import map_auth_error
 from app.shared.components.dialogs import Dialogs
+from app.shared.services.http_client import get_http_client
+from app.shared.services.storange_service import get_storage
+from app.shared.services.token_manager import get_token_manager
+from app.core.utils.update_scheduler import request_update
+
+
+# Janela em que o backend devolve a resposta já dada para um Idempotency-Key
+IDEMPOTENCY_WINDOW = 60.0
 
 
 class AuthController:
     def __init__(self, page):
         self.page = page
-        self.service = AuthService()
+        self.service = AuthService(get_http_client(page))
+        self.storage = get_storage(page)
+        self.tokens = get_token_manager(page)
+        self.password_rules = PasswordRuleEvaluator()
+        # (ação, digest do payload) -> (chave, criada em)
+        self._idempotency_keys: dict[tuple[str, str], tuple[str, float]] = {}
+
+    def _idempotency_key(self, action: str, payload: dict) -> str:
+        """Mesma chave para o mesmo payload deste formulário dentro da janela do backend.
+
+        Um segundo toque (ou reenvio depois da resposta) com os mesmos dados
+        reaproveita a chave, e o backend não repete o cadastro nem o e-mail.
+        """
+        digest = hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        now = time.monotonic()
+
+        self._idempotency_keys = {
+            slot: entry
+            for slot, entry in self._idempotency_keys.items()
+            if now - entry[1] < IDEMPOTENCY_WINDOW
+        }
+        entry = self._idempotency_keys.get((action, digest))
+        if entry is None:
+            entry = (str(uuid.uuid4()), now)
+            self._idempotency_keys[(action, digest)] = entry
+        return entry[0]
 
     # ─────────────────────────────
     # OAUTH GOOGLE
@@ -27,60 +67,123 @@ class AuthController:
         clean_data = data.copy()
         for key in keys_to_clean:
             if key in clean_data and isinstance(clean_data[key], str):
-                clean_data[key] = re.sub(r'\D', '', clean_data[key])
+                clean_data[key] = digits_only(clean_data[key])
         return clean_data
 
-    def register(self, *, data: dict, submit_button, fields: dict) -> None:
+    def _begin_register(self, data: dict, submit_button, fields: dict) -> bool:
         submit_button.set_loading(True)
         for field in fields.values():
             if hasattr(field, "clear_error"):
                 field.clear_error()
-        self.page.update()
+        request_update(self.page)
 
-        validation = AuthValidations.validate_register(data)
+        validation = AuthValidations.validate_register(data, evaluate=self.password_rules.evaluate)
         if not validation.is_valid:
             submit_button.set_loading(False)
             target_field = fields.get(validation.field)
             if target_field and hasattr(target_field, "set_error"):
                 target_field.set_error(validation.message)
-                target_field.update()
-            
+                request_update(target_field)
+
             Dialogs.error(self.page, validation.message)
+            return False
+        return True
+
+    def _on_register_success(self) -> None:
+        # A view de cadastro fica em cache: sem isso, voltar a /register
+        # mostraria senha, CPF/CNPJ etc. do cadastro já concluído
+        router = getattr(self.page, "router", None)
+        if router is not None:
+            router.invalidate(Routes.REGISTER)
+
+        Dialogs.success(self.page, "Sua conta foi criada com sucesso.")
+        self.page.go(Routes.LOGIN)
+
+    def _on_register_error(self, exc: Exception) -> None:
+        if isinstance(exc, ConflictError):
+            Dialogs.error(
+                self.page,
+                "Estes dados (E-mail, CPF ou CNPJ) já estão em uso por outra conta.\n"
+                "Por favor, verifique e tente novamente.",
+            )
+        else:
+            Dialogs.error(self.page, map_auth_error(exc))
+
+    def register(self, *, data: dict, submit_button, fields: dict) -> None:
+        if not self._begin_register(data, submit_button, fields):
             return
 
         try:
-            sanitized_payload = self.sanitize_data(data)
-            
-            self.service.register(payload=sanitized_payload)
-            
-            Dialogs.success(self.page, "Sua conta foi criada com sucesso.")
-            self.page.go(Routes.LOGIN)
-
-        except ConflictError:
-            Dialogs.error(self.page, "Estes dados (E-mail, CPF ou CNPJ) já estão em uso por outra conta.\n",
-                          "Por favor, verifique e tente novamente.")
+            payload = self.sanitize_data(data)
+            self.service.register(
+                payload=payload,
+                idempotency_key=self._idempotency_key("register", payload),
+            )
+            self._on_register_success()
         except Exception as exc:
-            Dialogs.error(self.page, map_auth_error(exc))
+            self._on_register_error(exc)
+        finally:
+            submit_button.set_loading(False)
+
+    async def register_async(self, *, data: dict, submit_button, fields: dict) -> None:
+        if not self._begin_register(data, submit_button, fields):
+            return
+
+        try:
+            payload = self.sanitize_data(data)
+            await self.service.register_async(
+                payload=payload,
+                idempotency_key=self._idempotency_key("register", payload),
+            )
+            self._on_register_success()
+        except Exception as exc:
+            self._on_register_error(exc)
         finally:
             submit_button.set_loading(False)
 
         # ─────────────────────────────
         # LOGIN
         # ─────────────────────────────
-    def login(self, *, email, password, email_field, password_field, submit_button):
+    def _validate_login(self, email, password, email_field, password_field) -> bool:
         email_field.clear_error()
         password_field.clear_error()
 
-        validation = AuthValidations.validate_login(email, password)
+        validation = AuthValidations.validate_login(
+            email, password, evaluate=self.password_rules.evaluate
+        )
         if not validation.is_valid:
             field = email_field if validation.field == "email" else password_field
             field.set_error(validation.message)
             Dialogs.error(self.page, validation.message)
+            return False
+        return True
+
+    def login(self, *, email, password, email_field, password_field, submit_button):
+        if not self._validate_login(email, password, email_field, password_field):
             return
 
         submit_button.set_loading(True)
         try:
-            self.service.login(email=email, password=password)
+            response = self.service.login(email=email, password=password)
+            self.tokens.set_token(response.get("token"))
+            # A view de login fica em cache: não manter a senha digitada
+            password_field.value = ""
+            self.page.go(Routes.HOME)
+        except Exception as exc:
+            Dialogs.error(self.page, map_auth_error(exc))
+        finally:
+            submit_button.set_loading(False)
+
+    async def login_async(self, *, email, password, email_field, password_field, submit_button):
+        if not self._validate_login(email, password, email_field, password_field):
+            return
+
+        submit_button.set_loading(True)
+        try:
+            response = await self.service.login_async(email=email, password=password)
+            await self.tokens.set_token_async(response.get("token"))
+            # A view de login fica em cache: não manter a senha digitada
+            password_field.value = ""
             self.page.go(Routes.HOME)
         except Exception as exc:
             Dialogs.error(self.page, map_auth_error(exc))
@@ -90,75 +193,155 @@ class AuthController:
     # ─────────────────────────────
     # FORGOT PASSWORD
     # ─────────────────────────────
-    def forgot_password(self, *, email, email_field, submit_button):
+    def _validate_forgot_password(self, email, email_field) -> bool:
         email_field.clear_error()
 
         validation = AuthValidations.validate_forgot_password(email)
         if not validation.is_valid:
             email_field.set_error(validation.message)
             Dialogs.error(self.page, validation.message)
+            return False
+        return True
+
+    def _on_forgot_password_error(self, exc: Exception) -> None:
+        if isinstance(exc, NotFoundError):
+            Dialogs.error(self.page, "Email não cadastrado. Por favor, tente novamente.")
+        else:
+            Dialogs.error(self.page, map_auth_error(exc))
+
+    def _on_forgot_password_success(self) -> None:
+        Dialogs.success(
+            self.page,
+            "Enviamos um token para redefinição de senha.\n"
+            "Verifique sua caixa de entrada. Caso não encontre, confira também o Spam ou a Lixeira.",
+        )
+        self.page.go(Routes.RESET_PASSWORD_TOKEN)
+
+    def forgot_password(self, *, email, email_field, submit_button):
+        if not self._validate_forgot_password(email, email_field):
             return
 
         submit_button.set_loading(True)
         try:
-            response = self.service.request_password_reset(email=email)
+            response = self.service.request_password_reset(
+                email=email,
+                idempotency_key=self._idempotency_key("forgot_password", {"email": email}),
+            )
             if not response or not response.get("success"):
                 raise Exception("Resposta inválida do backend")
-        except NotFoundError:
-            Dialogs.error(self.page, "Email não cadastrado. Por favor, tente novamente.")
+        except Exception as exc:
+            self._on_forgot_password_error(exc)
             return
+        finally:
+            submit_button.set_loading(False)
+
+        self._on_forgot_password_success()
+
+    async def forgot_password_async(self, *, email, email_field, submit_button):
+        if not self._validate_forgot_password(email, email_field):
+            return
+
+        submit_button.set_loading(True)
+        try:
+            response = await self.service.request_password_reset_async(
+                email=email,
+                idempotency_key=self._idempotency_key("forgot_password", {"email": email}),
+            )
+            if not response or not response.get("success"):
+                raise Exception("Resposta inválida do backend")
         except Exception as exc:
-            Dialogs.error(self.page, map_auth_error(exc))
+            self._on_forgot_password_error(exc)
             return
         finally:
             submit_button.set_loading(False)
 
-        Dialogs.success(
-            self.page,
-            "Enviamos um token para redefinição de senha.\n"
-            "Verifique sua caixa de entrada. Caso não encontre, confira também o Spam ou a Lixeira.",
-        )
-        self.page.go(Routes.RESET_PASSWORD_TOKEN)
+        self._on_forgot_password_success()
 
     # ─────────────────────────────
     # VALIDATE RESET TOKEN
     # ─────────────────────────────
-    def validate_reset_token(self, *, token, token_field, submit_button):
+    def _validate_reset_token(self, token, token_field) -> bool:
         token_field.clear_error()
 
         validation = AuthValidations.validate_reset_token(token)
         if not validation.is_valid:
             token_field.set_error(validation.message)
             Dialogs.error(self.page, validation.message)
+            return False
+        return True
+
+    def _on_reset_attempts_exceeded(self) -> None:
+        Dialogs.error(
+            self.page,
+            "Você excedeu o número máximo de tentativas. Solicite um novo token."
+        )
+        self.page.go(Routes.FORGOT_PASSWORD)
+
+    @staticmethod
+    def _reset_session_from(response: dict) -> str:
+        reset_session = response.get("reset_session")
+        if not reset_session:
+            raise Exception("Reset session não retornada pelo backend")
+        return reset_session
+
+    def _on_reset_token_error(self, exc: Exception, attempts: int, token_field) -> int | None:
+        """Mostra o erro; devolve o novo total de tentativas quando o token foi recusado."""
+        if isinstance(exc, (UnprocessableEntityError, NotFoundError)):
+            attempts += 1
+            token_field.set_error("Token inválido.")
+            Dialogs.error(self.page, f"Token inválido. Tentativa {attempts}/3.")
+            return attempts
+        Dialogs.error(self.page, map_auth_error(exc))
+        return None
+
+    def validate_reset_token(self, *, token, token_field, submit_button):
+        if not self._validate_reset_token(token, token_field):
             return
 
-        attempts = self.page.client_storage.get("reset_token_attempts") or 0
+        attempts = self.storage.get("reset_token_attempts") or 0
         if attempts >= 3:
-            Dialogs.error(
-                self.page,
-                "Você excedeu o número máximo de tentativas. Solicite um novo token."
-            )
-            self.page.client_storage.remove("reset_token_attempts")
-            self.page.go(Routes.FORGOT_PASSWORD)
+            self.storage.remove("reset_token_attempts")
+            self._on_reset_attempts_exceeded()
             return
 
         submit_button.set_loading(True)
         try:
             response = self.service.validate_reset_token(token=token)
-            reset_session = response.get("reset_session")
-            if not reset_session:
-                raise Exception("Reset session não retornada pelo backend")
+            reset_session = self._reset_session_from(response)
+            with self.storage.batch():
+                self.storage.set("reset_session", reset_session)
+                self.storage.remove("reset_token_attempts")
+        except Exception as exc:
+            attempts = self._on_reset_token_error(exc, attempts, token_field)
+            if attempts is not None:
+                self.storage.set("reset_token_attempts", attempts)
+            return
+        finally:
+            submit_button.set_loading(False)
 
-            self.page.client_storage.set("reset_session", reset_session)
-            self.page.client_storage.remove("reset_token_attempts")
-        except (UnprocessableEntityError, NotFoundError):
-            attempts += 1
-            self.page.client_storage.set("reset_token_attempts", attempts)
-            token_field.set_error("Token inválido.")
-            Dialogs.error(self.page, f"Token inválido. Tentativa {attempts}/3.")
+        self.page.go(Routes.RESET_PASSWORD_NEW)
+
+    async def validate_reset_token_async(self, *, token, token_field, submit_button):
+        if not self._validate_reset_token(token, token_field):
             return
+
+        attempts = await self.storage.get_async("reset_token_attempts") or 0
+        if attempts >= 3:
+            await self.storage.remove_async("reset_token_attempts")
+            self._on_reset_attempts_exceeded()
+            return
+
+        submit_button.set_loading(True)
+        try:
+            response = await self.service.validate_reset_token_async(token=token)
+            reset_session = self._reset_session_from(response)
+            async with self.storage.batch_async():
+                self.storage.set("reset_session", reset_session)
+                self.storage.remove("reset_token_attempts")
         except Exception as exc:
-            Dialogs.error(self.page, map_auth_error(exc))
+            attempts = self._on_reset_token_error(exc, attempts, token_field)
+            if attempts is not None:
+                await self.storage.set_async("reset_token_attempts", attempts)
             return
         finally:
             submit_button.set_loading(False)
@@ -168,6 +351,32 @@ class AuthController:
     # ─────────────────────────────
     # SET NEW PASSWORD
     # ─────────────────────────────
+    def _validate_new_password(
+        self, password, confirm_password, password_field, confirm_password_field
+    ) -> bool:
+        password_field.clear_error()
+        confirm_password_field.clear_error()
+
+        validation = AuthValidations.validate_new_password(
+            password, confirm_password, evaluate=self.password_rules.evaluate
+        )
+        if not validation.is_valid:
+            field = password_field if validation.field == "password" else confirm_password_field
+            field.set_error(validation.message)
+            Dialogs.error(self.page, validation.message)
+            return False
+        return True
+
+    def _on_reset_session_missing(self) -> None:
+        Dialogs.error(self.page, "Sessão expirada. Solicite um novo token.")
+        self.page.go(Routes.FORGOT_PASSWORD)
+
+    def _on_new_password_saved(self, password_field, confirm_password_field) -> None:
+        password_field.value = ""
+        confirm_password_field.value = ""
+        Dialogs.success(self.page, "Senha redefinida com sucesso.")
+        self.page.go(Routes.LOGIN)
+
     def set_new_password(
         self,
         *,
@@ -177,34 +386,55 @@ class AuthController:
         confirm_password_field,
         submit_button,
     ):
-        password_field.clear_error()
-        confirm_password_field.clear_error()
-
-        validation = AuthValidations.validate_new_password(password, confirm_password)
-        if not validation.is_valid:
-            field = password_field if validation.field == "password" else confirm_password_field
-            field.set_error(validation.message)
-            Dialogs.error(self.page, validation.message)
+        if not self._validate_new_password(
+            password, confirm_password, password_field, confirm_password_field
+        ):
             return
 
-        reset_session = self.page.client_storage.get("reset_session")
+        reset_session = self.storage.get("reset_session")
         if not reset_session:
-            Dialogs.error(self.page, "Sessão expirada. Solicite um novo token.")
-            self.page.go(Routes.FORGOT_PASSWORD)
+            self._on_reset_session_missing()
             return
 
         submit_button.set_loading(True)
         try:
             self.service.reset_password(reset_session=reset_session, password=password)
-            self.page.client_storage.remove("reset_session")
-            self.page.client_storage.remove("reset_token_attempts")
-            password_field.value = ""
-            confirm_password_field.value = ""
+            self.storage.remove("reset_session", "reset_token_attempts")
         except Exception as exc:
             Dialogs.error(self.page, map_auth_error(exc))
             return
         finally:
             submit_button.set_loading(False)
 
-        Dialogs.success(self.page, "Senha redefinida com sucesso.")
-        self.page.go(Routes.LOGIN)
\ No newline at end of file
+        self._on_new_password_saved(password_field, confirm_password_field)
+
+    async def set_new_password_async(
+        self,
+        *,
+        password,
+        confirm_password,
+        password_field,
+        confirm_password_field,
+        submit_button,
+    ):
+        if not self._validate_new_password(
+            password, confirm_password, password_field, confirm_password_field
+        ):
+            return
+
+        reset_session = await self.storage.get_async("reset_session")
+        if not reset_session:
+            self._on_reset_session_missing()
+            return
+
+        submit_button.set_loading(True)
+        try:
+            await self.service.reset_password_async(reset_session=reset_session, password=password)
+            await self.storage.remove_async("reset_session", "reset_token_attempts")
+        except Exception as exc:
+            Dialogs.error(self.page, map_auth_error(exc))
+            return
+        finally:
+            submit_button.set_loading(False)
+
+        self._on_new_password_saved(password_field, confirm_password_field)
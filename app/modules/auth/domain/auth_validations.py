@@ -1,6 +1,25 @@
 from dataclasses import dataclass
+from typing import Callable
 import re
 from app.core.utils.validators import PASSWORD_MAX_LEN, PASSWORD_MIN_LEN, is_required, is_email
+from app.modules.auth.domain.document_batch import (
+    BatchValidation,
+    digits_only,
+    validate_cnpj_batch,
+    validate_cpf_batch,
+)
+from app.modules.auth.domain.password_rules import (
+    DIGIT,
+    LENGTH,
+    LOWER,
+    SYMBOL,
+    UPPER,
+    PasswordRuleResult,
+    evaluate_password,
+)
+
+# Avaliador das regras de senha: o padrão é sem memo; controllers passam o seu
+PasswordEvaluate = Callable[[str], PasswordRuleResult]
 
 
 @dataclass(frozen=True)
@@ -12,11 +31,11 @@ class ValidationResult:
 
 class AuthValidations:
     @staticmethod
-    def validate_register(data: dict) -> ValidationResult:
+    def validate_register(data: dict, *, evaluate: PasswordEvaluate = evaluate_password) -> ValidationResult:
         if not is_email(data.get("email", "")):
             return ValidationResult(False, "E-mail inválido", "email")
         
-        pw_res = AuthValidations.validate_password_strength(data.get("password", ""))
+        pw_res = AuthValidations.validate_password_strength(data.get("password", ""), evaluate=evaluate)
         if not pw_res.is_valid: return pw_res
         
         if data.get("password") != data.get("confirm_password"):
@@ -41,32 +60,35 @@ class AuthValidations:
         return ValidationResult(True)
 
     @staticmethod
-    def validate_password_strength(password: str) -> ValidationResult:
+    def validate_password_strength(
+        password: str, *, evaluate: PasswordEvaluate = evaluate_password
+    ) -> ValidationResult:
         if not is_required(password):
             return ValidationResult(False, "Informe sua senha.", "password")
-    
-        if not AuthValidations.has_valid_length(password):
+
+        rules = evaluate(password)
+        if not rules.has(LENGTH):
             return ValidationResult(
                 False,
                 f"A senha deve ter entre {PASSWORD_MIN_LEN} e {PASSWORD_MAX_LEN} caracteres.",
                 "password",
             )
     
-        if not AuthValidations.has_upper_and_lower(password):
+        if not rules.has(UPPER | LOWER):
             return ValidationResult(
                 False,
                 "A senha deve conter letras maiúsculas e minúsculas.",
                 "password",
             )
     
-        if not AuthValidations.has_number(password):
+        if not rules.has(DIGIT):
             return ValidationResult(
                 False,
                 "A senha deve conter pelo menos um número.",
                 "password",
             )
     
-        if not AuthValidations.has_symbol(password):
+        if not rules.has(SYMBOL):
             return ValidationResult(
                 False,
                 "A senha deve conter pelo menos um símbolo.",
@@ -76,7 +98,9 @@ class AuthValidations:
         return ValidationResult(True)
 
     @staticmethod
-    def validate_login(email: str, password: str) -> ValidationResult:
+    def validate_login(
+        email: str, password: str, *, evaluate: PasswordEvaluate = evaluate_password
+    ) -> ValidationResult:
         email = (email or "").strip()
         password = password or ""
 
@@ -86,7 +110,7 @@ class AuthValidations:
         if not is_email(email):
             return ValidationResult(False, "Email inválido.", "email")
 
-        return AuthValidations.validate_password_strength(password)
+        return AuthValidations.validate_password_strength(password, evaluate=evaluate)
     
     @staticmethod
     def validate_forgot_password(email: str) -> ValidationResult:
@@ -114,8 +138,10 @@ class AuthValidations:
     
     
     @staticmethod
-    def validate_new_password(password: str, confirm_password: str) -> ValidationResult:
-        result = AuthValidations.validate_password_strength(password)
+    def validate_new_password(
+        password: str, confirm_password: str, *, evaluate: PasswordEvaluate = evaluate_password
+    ) -> ValidationResult:
+        result = AuthValidations.validate_password_strength(password, evaluate=evaluate)
         if not result.is_valid:
             return result
 
@@ -126,23 +152,23 @@ class AuthValidations:
     
     @staticmethod
     def has_valid_length(password: str) -> bool:
-        return PASSWORD_MIN_LEN <= len(password) <= PASSWORD_MAX_LEN
+        return evaluate_password(password).has(LENGTH)
 
     @staticmethod
     def has_upper_and_lower(password: str) -> bool:
-        return bool(re.search(r"[A-Z]", password)) and bool(re.search(r"[a-z]", password))
+        return evaluate_password(password).has(UPPER | LOWER)
 
     @staticmethod
     def has_number(password: str) -> bool:
-        return bool(re.search(r"\d", password))
+        return evaluate_password(password).has(DIGIT)
 
     @staticmethod
     def has_symbol(password: str) -> bool:
-        return bool(re.search(r"[^\w\s]", password))
+        return evaluate_password(password).has(SYMBOL)
     
     @staticmethod
     def validate_cpf(cpf: str) -> bool:
-        cpf = re.sub(r'\D', '', cpf)
+        cpf = digits_only(cpf)
         if len(cpf) != 11 or cpf == cpf[0] * 11: return False
         for i in range(9, 11):
             val = sum(int(cpf[num]) * ((i + 1) - num) for num in range(i))
@@ -152,7 +178,7 @@ class AuthValidations:
 
     @staticmethod
     def validate_cnpj(cnpj: str) -> bool:
-        cnpj = re.sub(r'\D', '', cnpj)
+        cnpj = digits_only(cnpj)
         if len(cnpj) != 14 or cnpj == cnpj[0] * 14: return False
         
         def check_digit(s, weights):
@@ -164,4 +190,12 @@ class AuthValidations:
         
         if check_digit(cnpj[:12], w1) != int(cnpj[12]): return False
         if check_digit(cnpj[:13], w2) != int(cnpj[13]): return False
-        return True
\ No newline at end of file
+        return True
+
+    @staticmethod
+    def validate_cpf_batch(cpfs) -> BatchValidation:
+        return validate_cpf_batch(cpfs)
+
+    @staticmethod
+    def validate_cnpj_batch(cnpjs) -> BatchValidation:
+        return validate_cnpj_batch(cnpjs)
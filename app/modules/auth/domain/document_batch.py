@@ -0,0 +1,152 @@
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # dependência opcional
+    np = None
+
+CPF_SIZE = 11
+CNPJ_SIZE = 14
+
+CPF_WEIGHTS_1 = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+CPF_WEIGHTS_2 = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+CNPJ_WEIGHTS_1 = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+CNPJ_WEIGHTS_2 = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
+class DocumentReason(IntEnum):
+    VALID = 0
+    WRONG_LENGTH = 1
+    REPEATED_DIGITS = 2
+    FIRST_CHECK_DIGIT = 3
+    SECOND_CHECK_DIGIT = 4
+
+
+@dataclass(frozen=True)
+class BatchValidation:
+    """`valid[i]` diz se o documento i é válido; `reasons[i]` traz o DocumentReason.
+
+    Com NumPy são arrays (bool / uint8); sem NumPy, listas.
+    """
+
+    valid: Sequence[bool]
+    reasons: Sequence[int]
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    @property
+    def invalid_count(self) -> int:
+        return len(self.valid) - int(sum(self.valid))
+
+
+# Funções do dígito verificador: servem tanto para int quanto para arrays
+def _cpf_digit(total):
+    return (total * 10 % 11) % 10
+
+
+def _cnpj_digit(total):
+    rest = total % 11
+    return (rest >= 2) * (11 - rest)
+
+
+def digits_only(text: str) -> str:
+    """Só os dígitos do texto, como ASCII.
+
+    Qualquer dígito decimal Unicode conta (ex.: "５" de largura total), como o
+    `\\d` do regex: o validador unitário e o em lote aceitam a mesma entrada.
+    """
+    if text.isascii():
+        return "".join(char for char in text if "0" <= char <= "9")
+    return "".join(str(int(char)) for char in text if char.isdecimal())
+
+
+def validate_cpf_batch(documents: Iterable[str]) -> BatchValidation:
+    return _validate_batch(documents, CPF_SIZE, CPF_WEIGHTS_1, CPF_WEIGHTS_2, _cpf_digit)
+
+
+def validate_cnpj_batch(documents: Iterable[str]) -> BatchValidation:
+    return _validate_batch(documents, CNPJ_SIZE, CNPJ_WEIGHTS_1, CNPJ_WEIGHTS_2, _cnpj_digit)
+
+
+def _validate_batch(documents, size, weights_1, weights_2, check_digit) -> BatchValidation:
+    if np is None:
+        return _validate_python(documents, size, weights_1, weights_2, check_digit)
+
+    digits, has_size = _digit_matrix(documents, size)
+
+    # Mesma ordem de checagem do validador unitário
+    first = check_digit(digits[:, : size - 2] @ np.asarray(weights_1))
+    second = check_digit(digits[:, : size - 1] @ np.asarray(weights_2))
+    sized_reasons = np.select(
+        [
+            (digits == digits[:, :1]).all(axis=1),
+            first != digits[:, size - 2],
+            second != digits[:, size - 1],
+        ],
+        [
+            DocumentReason.REPEATED_DIGITS,
+            DocumentReason.FIRST_CHECK_DIGIT,
+            DocumentReason.SECOND_CHECK_DIGIT,
+        ],
+        DocumentReason.VALID,
+    )
+
+    reasons = np.full(has_size.shape[0], DocumentReason.WRONG_LENGTH, dtype=np.uint8)
+    reasons[has_size] = sized_reasons
+    return BatchValidation(valid=reasons == DocumentReason.VALID, reasons=reasons)
+
+
+def _digit_matrix(documents, size: int):
+    """Matriz (m, size) de dígitos das linhas com exatamente `size` dígitos.
+
+    O array `<U` é visto como uint32 (um code point por coluna), então
+    pontuação como "123.456.789-09" é descartada sem laço em Python; só as
+    linhas com dígitos não ASCII são normalizadas uma a uma.
+    """
+    if not isinstance(documents, (np.ndarray, list, tuple)):
+        documents = list(documents)
+    texts = np.ascontiguousarray(np.asarray(documents, dtype=np.str_).ravel())
+    width = texts.dtype.itemsize // 4
+    if width == 0:
+        return np.empty((0, size), dtype=np.int64), np.zeros(texts.shape[0], dtype=bool)
+
+    codes = texts.view(np.uint32).reshape(texts.shape[0], width)
+
+    # Linhas com caracteres não ASCII (raras) passam por digits_only em Python
+    non_ascii = np.flatnonzero((codes >= 128).any(axis=1))
+    if non_ascii.size:
+        texts = texts.copy()
+        for index in non_ascii:
+            texts[index] = digits_only(str(texts[index]))
+        codes = texts.view(np.uint32).reshape(texts.shape[0], width)
+    is_digit = (codes >= ord("0")) & (codes <= ord("9"))
+    has_size = is_digit.sum(axis=1) == size
+
+    # Ordem row-major: os dígitos de cada linha saem contíguos e em ordem
+    digits = codes[has_size][is_digit[has_size]].astype(np.int64) - ord("0")
+    return digits.reshape(-1, size), has_size
+
+
+def _validate_python(documents, size, weights_1, weights_2, check_digit) -> BatchValidation:
+    reasons: list[int] = []
+    for document in documents:
+        digits = [ord(char) - 48 for char in digits_only(str(document))]
+        if len(digits) != size:
+            reason = DocumentReason.WRONG_LENGTH
+        elif digits.count(digits[0]) == size:
+            reason = DocumentReason.REPEATED_DIGITS
+        elif check_digit(sum(d * w for d, w in zip(digits, weights_1))) != digits[size - 2]:
+            reason = DocumentReason.FIRST_CHECK_DIGIT
+        elif check_digit(sum(d * w for d, w in zip(digits, weights_2))) != digits[size - 1]:
+            reason = DocumentReason.SECOND_CHECK_DIGIT
+        else:
+            reason = DocumentReason.VALID
+        reasons.append(int(reason))
+
+    return BatchValidation(
+        valid=[reason == DocumentReason.VALID for reason in reasons],
+        reasons=reasons,
+    )
@@ -0,0 +1,91 @@
+from typing import NamedTuple
+
+from app.core.utils.validators import PASSWORD_MAX_LEN, PASSWORD_MIN_LEN
+
+# Bits na mesma ordem das regras exibidas no PasswordRulesCard
+LENGTH = 1 << 0
+UPPER = 1 << 1
+LOWER = 1 << 2
+DIGIT = 1 << 3
+SYMBOL = 1 << 4
+
+ALL_RULES = LENGTH | UPPER | LOWER | DIGIT | SYMBOL
+
+
+class PasswordRuleResult(NamedTuple):
+    mask: int
+    length: int
+
+    @property
+    def is_strong(self) -> bool:
+        return self.mask == ALL_RULES
+
+    def has(self, rule: int) -> bool:
+        return self.mask & rule == rule
+
+    @property
+    def missing(self) -> int:
+        return ALL_RULES & ~self.mask
+
+
+def _classify(char: str) -> int:
+    # Mesma semântica dos regex antigos: [A-Z], [a-z], \d e [^\w\s]
+    if "A" <= char <= "Z":
+        return UPPER
+    if "a" <= char <= "z":
+        return LOWER
+    if char.isdecimal():
+        return DIGIT
+    if char.isalnum() or char == "_" or char.isspace():
+        return 0
+    return SYMBOL
+
+
+# Bytes ASCII traduzidos para o bit da sua classe em C (bytes.translate);
+# só os caracteres não ASCII distintos caem no _classify em Python
+_ASCII_TABLE = bytes(_classify(chr(code)) for code in range(128)) + bytes(128)
+
+
+def _scan(password: str) -> PasswordRuleResult:
+    mask = 0
+    if password.isascii():
+        for bit in set(password.encode("ascii").translate(_ASCII_TABLE)):
+            mask |= bit
+    else:
+        for char in set(password):
+            mask |= _classify(char)
+
+    length = len(password)
+    if PASSWORD_MIN_LEN <= length <= PASSWORD_MAX_LEN:
+        mask |= LENGTH
+    return PasswordRuleResult(mask, length)
+
+
+def evaluate_password(password: str) -> PasswordRuleResult:
+    """Avalia todas as regras de senha em uma única passada pela string."""
+    return _scan(password or "")
+
+
+class PasswordRuleEvaluator:
+    """`evaluate_password` com o último valor memorizado, por instância.
+
+    Cada card/controller tem o seu: nada de senha de uma sessão guardada em
+    estado global, e teclas repetidas (ou o submit logo após a digitação)
+    não repetem a varredura.
+    """
+
+    def __init__(self):
+        self._last: tuple[str, PasswordRuleResult] | None = None
+
+    def evaluate(self, password: str) -> PasswordRuleResult:
+        password = password or ""
+        last = self._last
+        if last is not None and last[0] == password:
+            return last[1]
+
+        result = _scan(password)
+        self._last = (password, result)
+        return result
+
+    def clear(self) -> None:
+        self._last = None
@@ -1,12 +1,9 @@
-import flet as ft
-
-from flet.auth.providers.google_oauth_provider import GoogleOAuthProvider
 from app.shared.services.http_client import HttpClient
 
 
 class AuthService:
-    def __init__(self):
-        self.http = HttpClient()
+    def __init__(self, http: HttpClient | None = None):
+        self.http = http or HttpClient()
 
     # ─────────────────────────────
     # OAUTH GOOGLE
@@ -18,15 +15,35 @@ class AuthService:
     # CADASTRO
     # ─────────────────────────────
 
-    def register(self, *, payload: dict) -> None:
-        self.http.post("/auth/register", json=payload)
+    def register(self, *, payload: dict, idempotency_key: str | None = None) -> None:
+        self.http.post(
+            "/auth/register",
+            json=payload,
+            idempotency_key=idempotency_key,
+        )
+
+    async def register_async(self, *, payload: dict, idempotency_key: str | None = None) -> None:
+        await self.http.post_async(
+            "/auth/register",
+            json=payload,
+            idempotency_key=idempotency_key,
+        )
 
     # ─────────────────────────────
     # LOGIN
     # ─────────────────────────────
 
-    def login(self, *, email: str, password: str) -> None:
-        self.http.post(
+    def login(self, *, email: str, password: str) -> dict:
+        return self.http.post(
+            "/auth/login",
+            json={
+                "email": email,
+                "password": password,
+            },
+        )
+
+    async def login_async(self, *, email: str, password: str) -> dict:
+        return await self.http.post_async(
             "/auth/login",
             json={
                 "email": email,
@@ -38,10 +55,18 @@ class AuthService:
     # FORGOT PASSWORD
     # ─────────────────────────────
 
-    def request_password_reset(self, *, email: str) -> dict:
+    def request_password_reset(self, *, email: str, idempotency_key: str | None = None) -> dict:
         return self.http.post(
             "/auth/forgot-password",
             json={"email": email},
+            idempotency_key=idempotency_key,
+        )
+
+    async def request_password_reset_async(self, *, email: str, idempotency_key: str | None = None) -> dict:
+        return await self.http.post_async(
+            "/auth/forgot-password",
+            json={"email": email},
+            idempotency_key=idempotency_key,
         )
 
     # ─────────────────────────────
@@ -54,6 +79,12 @@ class AuthService:
             json={"token": token},
         )
 
+    async def validate_reset_token_async(self, *, token: str) -> dict:
+        return await self.http.post_async(
+            "/auth/validate-reset-token",
+            json={"token": token},
+        )
+
     # ─────────────────────────────
     # RESET PASSWORD
     # ─────────────────────────────
@@ -65,4 +96,13 @@ class AuthService:
                 "reset_session": reset_session,
                 "new_password": password,
             },
-        )
\ No newline at end of file
+        )
+
+    async def reset_password_async(self, *, reset_session: str, password: str) -> None:
+        await self.http.post_async(
+            "/auth/reset-password",
+            json={
+                "reset_session": reset_session,
+                "new_password": password,
+            },
+        )
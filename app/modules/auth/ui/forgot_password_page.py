@@ -15,8 +15,8 @@ def build_forgot_password_page(page: ft.Page) -> ft.Control:
 
     email_input = AppTextField(page=page, label="E-mail")
 
-    def on_submit(e):
-        controller.forgot_password(
+    async def on_submit(e):
+        await controller.forgot_password_async(
             email=email_input.value,
             email_field=email_input,
             submit_button=submit_button,
@@ -20,8 +20,8 @@ def build_login_page(page: ft.Page) -> ft.Control:
     email_input.value = ""
     password_input.value = ""
 
-    def on_submit(e):
-        controller.login(
+    async def on_submit(e):
+        await controller.login_async(
             email=email_input.value,
             password=password_input.value,
             email_field=email_input,
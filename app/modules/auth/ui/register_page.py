@@ -9,6 +9,7 @@ from app.shared.components.buttons.link_button import LinkButton
 from app.shared.components.buttons.primary_button import PrimaryButton
 from app.shared.components.inputs.password_rules_card import PasswordRulesCard
 from app.shared.components.inputs.text_field import AppTextField
+from app.core.utils.update_scheduler import request_update
 
 def build_register_page(page: ft.Page) -> ft.Control:
     controller = AuthController(page)
@@ -73,16 +74,15 @@ def build_register_page(page: ft.Page) -> ft.Control:
         pf_container.visible = is_pf
         pj_container.visible = not is_pf
         fields["is_mei"].visible = not is_pf
-        page.update()
+        request_update(page)
 
     person_type_radio.on_change = toggle_fields
 
     # --- Ações ---
     google_btn = GoogleAuthButton(on_click=lambda _: controller.login_with_google(button=google_btn))
     
-    submit_button = PrimaryButton(
-        text="Criar conta",
-        on_click=lambda _: controller.register(
+    async def on_submit(_):
+        await controller.register_async(
             data={
                 "person_type": person_type_radio.value,
                 "is_mei": fields["is_mei"].value,
@@ -90,8 +90,9 @@ def build_register_page(page: ft.Page) -> ft.Control:
             },
             submit_button=submit_button,
             fields=fields,
-        ),
-    )
+        )
+
+    submit_button = PrimaryButton(text="Criar conta", on_click=on_submit)
 
     return ft.Container(
         padding=ft.padding.symmetric(vertical=62, horizontal=16),
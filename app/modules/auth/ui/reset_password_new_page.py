@@ -35,8 +35,8 @@ def build_reset_password_new_page(page: ft.Page) -> ft.Control:
 
     password_input.on_change = on_password_change
 
-    def on_submit(e):
-        controller.set_new_password(
+    async def on_submit(e):
+        await controller.set_new_password_async(
             password=password_input.value,
             confirm_password=confirm_password_input.value,
             password_field=password_input,
@@ -9,7 +9,7 @@ from app.shared.components.buttons.primary_button import PrimaryButton
 from app.shared.components.buttons.link_button import LinkButton
 
 
-def build_reset_password_token_page(page: ft.Page) -> ft.Control:
+def build_reset_password_token_page(page: ft.Page, token: str = "") -> ft.Control:
     controller = AuthController(page)
     scheme = ThemeResolver.get_scheme(page)
 
@@ -17,10 +17,11 @@ def build_reset_password_token_page(page: ft.Page) -> ft.Control:
         page=page,
         label="Token recebido",
         keyboard_type=ft.KeyboardType.NUMBER,
+        value=token,
     )
 
-    def on_submit(e):
-        controller.validate_reset_token(
+    async def on_submit(e):
+        await controller.validate_reset_token_async(
             token=token_input.value,
             token_field=token_input,
             submit_button=submit_button,
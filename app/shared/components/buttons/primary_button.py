@@ -1,4 +1,7 @@
+import inspect
+
 import flet as ft
+from app.core.utils.update_scheduler import request_update
 
 
 class PrimaryButton(ft.Container):
@@ -22,7 +25,11 @@ class PrimaryButton(ft.Container):
             height=48,
             border_radius=12,
             bgcolor=ft.Colors.PRIMARY,
-            on_click=self._handle_click,
+            on_click=(
+                self._handle_click_async
+                if inspect.iscoroutinefunction(on_click)
+                else self._handle_click
+            ),
             animate_opacity=120,
             content=self.label,
         )
@@ -31,6 +38,10 @@ class PrimaryButton(ft.Container):
         if not self._loading:
             self._on_click(e)
 
+    async def _handle_click_async(self, e):
+        if not self._loading:
+            await self._on_click(e)
+
     def set_loading(self, value: bool):
         self._loading = value
         self.content = (
@@ -39,4 +50,4 @@ class PrimaryButton(ft.Container):
             else self.label
         )
         self.opacity = 0.7 if value else 1
-        self.update()
+        request_update(self)
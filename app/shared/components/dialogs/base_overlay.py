@@ -2,33 +2,38 @@ import flet as ft
 
 from app.core.theme.theme_resolver import ThemeResolver
 from app.shared.components.buttons.primary_button import PrimaryButton
+from app.core.utils.update_scheduler import request_update
 
 
-def show_overlay(page: ft.Page, *, icon, icon_color, message: str):
-    if page is None or not page.views:
-        return
-    
-    def close_overlay(_=None):
-        page.overlay.clear()
-        page.update()
+class SessionOverlay:
+    """Scrim + sheet criados uma vez por sessão e reaproveitados por todos os diálogos.
 
-        if hasattr(page, "dialog_queue"):
-            page.dialog_queue.notify_closed()
+    Mostrar um diálogo só troca ícone, texto e contador; os updates ficam
+    restritos a esses dois controles.
+    """
 
-        if hasattr(page, "_active_overlay"):
-            delattr(page, "_active_overlay")
+    def __init__(self, page: ft.Page):
+        self.page = page
 
-    def render_overlay():
-        scheme = ThemeResolver.get_scheme(page)
+        self.icon = ft.Icon(ft.Icons.INFO_OUTLINE, size=48)
+        self.message = ft.Text(text_align=ft.TextAlign.CENTER)
+        self.badge_text = ft.Text(size=12, weight=ft.FontWeight.W_600, color=ft.Colors.WHITE)
+        self.badge = ft.Container(
+            visible=False,
+            border_radius=10,
+            padding=ft.padding.symmetric(horizontal=8, vertical=2),
+            content=self.badge_text,
+        )
 
-        scrim = ft.Container(
+        self.scrim = ft.Container(
             expand=True,
+            visible=False,
             bgcolor=ft.Colors.with_opacity(0.6, ft.Colors.BLACK),
-            on_click=close_overlay,
+            on_click=self.close,
         )
 
-        sheet = ft.Container(
-            bgcolor=scheme.surface,
+        self.sheet = ft.Container(
+            visible=False,
             border_radius=ft.border_radius.vertical(top=20),
             padding=ft.padding.symmetric(horizontal=24, vertical=48),
             bottom=0,
@@ -38,21 +43,71 @@ def show_overlay(page: ft.Page, *, icon, icon_color, message: str):
                 spacing=24,
                 horizontal_alignment=ft.CrossAxisAlignment.STRETCH,
                 controls=[
-                    ft.Icon(icon, color=icon_color, size=48),
-                    ft.Text(message, color=scheme.on_surface, text_align=ft.TextAlign.CENTER),
-                    PrimaryButton(text="OK", on_click=close_overlay),
+                    ft.Row(
+                        alignment=ft.MainAxisAlignment.CENTER,
+                        controls=[self.icon, self.badge],
+                    ),
+                    self.message,
+                    PrimaryButton(text="OK", on_click=self.close),
                 ],
             ),
         )
 
-        page.overlay.clear()
-        page.overlay.extend([scrim, sheet])
+        self._attached = False
+
+    def show(self, *, icon: str, icon_color: str, message: str, count: int = 1) -> bool:
+        if self.page is None or not self.page.views:
+            return False
+
+        scheme = ThemeResolver.get_scheme(self.page)
+        self.sheet.bgcolor = scheme.surface
+        self.message.color = scheme.on_surface
+
+        self.icon.name = icon
+        self.icon.color = icon_color
+        self.message.value = message
+        self.badge.bgcolor = icon_color
+        self._set_badge(count)
+
+        self.scrim.visible = True
+        self.sheet.visible = True
+        self._push()
+        return True
+
+    def set_count(self, count: int) -> None:
+        self._set_badge(count)
+        if self.sheet.visible:
+            request_update(self.badge)
+
+    def close(self, _=None) -> None:
+        if not self.sheet.visible:
+            return
+        self.scrim.visible = False
+        self.sheet.visible = False
+        self._push()
+
+        if hasattr(self.page, "dialog_queue"):
+            self.page.dialog_queue.notify_closed()
+
+    def _set_badge(self, count: int) -> None:
+        self.badge.visible = count > 1
+        self.badge_text.value = f"{count}x"
+
+    def _push(self) -> None:
+        if not self._attached:
+            # Primeira exibição: entra em page.overlay (propriedade da página)
+            self._attached = True
+            self.page.overlay.extend([self.scrim, self.sheet])
+            request_update(self.page)
+            return
+        request_update(self.scrim)
+        request_update(self.sheet)
+
 
-    page._active_overlay = {
-        "icon": icon,
-        "icon_color": icon_color,
-        "message": message,
-    }
+def get_overlay(page: ft.Page) -> SessionOverlay:
+    overlay = getattr(page, "session_overlay", None)
+    if overlay is None:
+        overlay = SessionOverlay(page)
+        page.session_overlay = overlay
+    return overlay
 
-    render_overlay()
-    page.update()
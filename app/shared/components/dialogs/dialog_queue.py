@@ -1,30 +1,125 @@
+import itertools
+import threading
+from dataclasses import dataclass, field
+from enum import IntEnum
+
 import flet as ft
-from collections import deque
-from typing import Callable
+
+from .base_overlay import get_overlay
+
+
+class DialogPriority(IntEnum):
+    INFO = 0
+    WARNING = 1
+    ERROR = 2
+
+
+@dataclass
+class DialogRequest:
+    icon: str
+    icon_color: str
+    message: str
+    priority: DialogPriority = DialogPriority.INFO
+    count: int = 1
+    seq: int = field(default=0, compare=False)
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.icon, self.message
+
 
 class DialogQueue:
-    def __init__(self, page: ft.Page):
+    """Fila de diálogos da sessão, exibidos um por vez no overlay persistente.
+
+    Mensagens iguais (mesmo ícone e texto) são fundidas em uma só, com contador;
+    a fila é limitada e sai por prioridade (erros primeiro), FIFO entre iguais.
+    """
+
+    def __init__(self, page: ft.Page, *, max_size: int = 8):
         self.page = page
-        self._queue: deque[Callable[[], None]] = deque()
-        self._is_showing = False
+        self.max_size = max_size
+        self._pending: list[DialogRequest] = []
+        self._current: DialogRequest | None = None
+        self._seq = itertools.count()
+        self._lock = threading.RLock()
 
-    def enqueue(self, dialog_fn: Callable[[], None]):
-        self._queue.append(dialog_fn)
-        self._try_show_next()
+    def enqueue(
+        self,
+        *,
+        icon: str,
+        icon_color: str,
+        message: str,
+        priority: DialogPriority = DialogPriority.INFO,
+    ) -> None:
+        request = DialogRequest(icon, icon_color, message, priority)
+
+        with self._lock:
+            if self._current is not None and self._current.key == request.key:
+                self._current.count += 1
+                current = self._current
+            else:
+                current = None
+                if not self._merge_pending(request) and self._make_room(request):
+                    request.seq = next(self._seq)
+                    self._pending.append(request)
 
-    def _try_show_next(self):
-        if self._is_showing or not self._queue:
+        if current is not None:
+            # Já está na tela: só o contador muda
+            self._overlay().set_count(current.count)
             return
+        self._try_show_next()
+
+    def _merge_pending(self, request: DialogRequest) -> bool:
+        for pending in self._pending:
+            if pending.key == request.key:
+                pending.count += 1
+                pending.priority = max(pending.priority, request.priority)
+                return True
+        return False
+
+    def _make_room(self, request: DialogRequest) -> bool:
+        if len(self._pending) < self.max_size:
+            return True
 
-        self._is_showing = True
-        dialog_fn = self._queue.popleft()
+        # Cheia: descarta o mais novo de menor prioridade, se o novo for mais importante
+        victim = min(self._pending, key=lambda item: (item.priority, -item.seq))
+        if victim.priority >= request.priority:
+            return False
+        self._pending.remove(victim)
+        return True
+
+    def _try_show_next(self) -> None:
+        with self._lock:
+            if self._current is not None or not self._pending:
+                return
+            request = max(self._pending, key=lambda item: (item.priority, -item.seq))
+            self._pending.remove(request)
+            self._current = request
 
         try:
-            dialog_fn()
+            shown = self._overlay().show(
+                icon=request.icon,
+                icon_color=request.icon_color,
+                message=request.message,
+                count=request.count,
+            )
         except Exception:
             self.notify_closed()
             raise
 
-    def notify_closed(self):
-        self._is_showing = False
-        self._try_show_next()
\ No newline at end of file
+        if not shown:
+            # Página ainda sem views: devolve à fila para a próxima tentativa
+            with self._lock:
+                self._current = None
+                self._pending.append(request)
+
+    def notify_closed(self) -> None:
+        with self._lock:
+            self._current = None
+        self._try_show_next()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _overlay(self):
+        return get_overlay(self.page)
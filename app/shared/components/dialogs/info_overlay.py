@@ -1,13 +1,10 @@
 import flet as ft
-from .base_overlay import show_overlay
+from .toast_channel import get_toasts
 from app.core.theme.colors import info
 
 def show_info(page: ft.Page, message: str):
-    page.dialog_queue.enqueue(
-        lambda: show_overlay(
-        page=page,
+    get_toasts(page).show(
         icon=ft.Icons.INFO_OUTLINE,
         icon_color=info,
         message=message,
-    )    
-)
\ No newline at end of file
+    )
@@ -1,14 +1,11 @@
 import flet as ft
-from .base_overlay import show_overlay
+from .toast_channel import get_toasts
 from app.core.theme.colors import success
 
-
 def show_success(page: ft.Page, message: str):
-    page.dialog_queue.enqueue(
-        lambda: show_overlay(
-        page=page,
+    # Confirmações de rotina não bloqueiam: vão para os toasts
+    get_toasts(page).show(
         icon=ft.Icons.CHECK_CIRCLE_OUTLINE,
         icon_color=success,
         message=message,
     )
-)
\ No newline at end of file
@@ -0,0 +1,153 @@
+import threading
+import time
+from dataclasses import dataclass
+
+import flet as ft
+
+from app.core.theme import spacing
+from app.core.theme.theme_resolver import ThemeResolver
+from app.core.utils.update_scheduler import request_update
+
+
+@dataclass(eq=False)
+class Toast:
+    icon: str
+    icon_color: str
+    message: str
+    expires_at: float
+
+
+class ToastChannel:
+    """Avisos não bloqueantes (info/sucesso) empilhados no topo da tela.
+
+    Os slots são criados uma vez por sessão; um único timer da sessão,
+    armado para o próximo vencimento, remove os avisos expirados. Só a
+    camada de toasts é atualizada.
+    """
+
+    def __init__(self, page: ft.Page, *, max_toasts: int = 3, duration: float = 4.0):
+        self.page = page
+        self.max_toasts = max_toasts
+        self.duration = duration
+        self._toasts: list[Toast] = []
+        self._timer: threading.Timer | None = None
+        self._lock = threading.RLock()
+        self._attached = False
+
+        self._slots = [self._build_slot() for _ in range(max_toasts)]
+        self.layer = ft.Container(
+            visible=False,
+            top=spacing.md,
+            left=spacing.md,
+            right=spacing.md,
+            content=ft.Column(spacing=spacing.sm, controls=self._slots),
+        )
+
+    def _build_slot(self) -> ft.Container:
+        return ft.Container(
+            visible=False,
+            border_radius=12,
+            padding=ft.padding.symmetric(horizontal=spacing.md, vertical=12),
+            # O slot guarda o Toast exibido: o clique remove esse aviso, mesmo
+            # que o timer tenha expirado outro entre o render e o toque
+            on_click=lambda e: self.dismiss(e.control.data),
+            content=ft.Row(
+                spacing=12,
+                controls=[
+                    ft.Icon(size=22),
+                    ft.Text(expand=True),
+                ],
+            ),
+        )
+
+    def show(self, *, icon: str, icon_color: str, message: str) -> None:
+        expires_at = time.monotonic() + self.duration
+        with self._lock:
+            # Mesmo aviso já visível: só renova o prazo
+            for toast in self._toasts:
+                if toast.icon == icon and toast.message == message:
+                    toast.expires_at = expires_at
+                    break
+            else:
+                self._toasts.append(Toast(icon, icon_color, message, expires_at))
+                del self._toasts[:-self.max_toasts]
+            self._schedule()
+        self._render()
+
+    def dismiss(self, toast: Toast | None) -> None:
+        with self._lock:
+            if toast is None or toast not in self._toasts:
+                return
+            self._toasts.remove(toast)
+            self._schedule()
+        self._render()
+
+    def close(self) -> None:
+        with self._lock:
+            self._toasts.clear()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._timer = None
+            remaining = [toast for toast in self._toasts if toast.expires_at > now]
+            changed = len(remaining) != len(self._toasts)
+            self._toasts = remaining
+            self._schedule()
+        if changed:
+            self._render()
+
+    def _schedule(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._toasts:
+            return
+
+        delay = max(0.0, min(toast.expires_at for toast in self._toasts) - time.monotonic())
+        self._timer = threading.Timer(delay, self._expire)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _render(self) -> None:
+        if self.page is None:
+            return
+
+        scheme = ThemeResolver.get_scheme(self.page)
+        with self._lock:
+            toasts = list(self._toasts)
+
+        for index, slot in enumerate(self._slots):
+            if index >= len(toasts):
+                slot.visible = False
+                slot.data = None
+                continue
+            toast = toasts[index]
+            icon, text = slot.content.controls
+            slot.data = toast
+            slot.visible = True
+            slot.bgcolor = scheme.surface_variant
+            icon.name = toast.icon
+            icon.color = toast.icon_color
+            text.value = toast.message
+            text.color = scheme.on_surface
+        self.layer.visible = bool(toasts)
+
+        if not self._attached:
+            # Primeira exibição: a camada entra em page.overlay
+            self._attached = True
+            self.page.overlay.append(self.layer)
+            request_update(self.page)
+            return
+        request_update(self.layer)
+
+
+def get_toasts(page: ft.Page) -> ToastChannel:
+    channel = getattr(page, "toast_channel", None)
+    if channel is None:
+        channel = ToastChannel(page)
+        page.toast_channel = channel
+    return channel
@@ -1,13 +1,26 @@
 import flet as ft
 
-from app.modules.auth.domain.auth_validations import AuthValidations
+from app.modules.auth.domain.password_rules import PasswordRuleEvaluator
 from app.core.utils.validators import PASSWORD_MIN_LEN, PASSWORD_MAX_LEN
 from app.core.theme import spacing
 from app.core.theme.typography import body_secondary, body_primary
 from app.core.theme.theme_resolver import ThemeResolver
+from app.core.theme.themeable_registry import Themeable
+from app.core.theme.tokens import tokens_for
+from app.core.utils.update_scheduler import request_update
 
 
-class PasswordRulesCard(ft.Container):
+# Mesma ordem dos bits de password_rules (LENGTH, UPPER, LOWER, DIGIT, SYMBOL)
+RULE_LABELS = (
+    f"Entre {PASSWORD_MIN_LEN} e {PASSWORD_MAX_LEN} caracteres",
+    "Letra maiúscula",
+    "Letra minúscula",
+    "Pelo menos um número",
+    "Pelo menos um caractere especial\n""(exemplo: @ ! $ & #)",
+)
+
+
+class PasswordRulesCard(Themeable, ft.Container):
     def __init__(
         self,
         *,
@@ -21,6 +34,8 @@ class PasswordRulesCard(ft.Container):
             self._scheme = color_scheme
 
         self._password = password or ""
+        self._rules = PasswordRuleEvaluator()
+        self._mask = self._rules.evaluate(self._password).mask
 
         super().__init__(
             padding=spacing.md,
@@ -31,48 +46,58 @@ class PasswordRulesCard(ft.Container):
         self._build()
 
     def _build(self):
-        pwd = self._password
-        self.bgcolor = self._scheme.surface_variant
+        # Linhas criadas uma única vez; depois só ícones/cores são alterados
+        self._title = ft.Text(
+            "Sua senha deve conter:",
+            style=body_primary,
+            color=self._scheme.on_surface,
+        )
+        self._icons: list[ft.Icon] = []
+        self._labels: list[ft.Text] = []
+        rows = [
+            self._rule_row(label, bool(self._mask & (1 << bit)))
+            for bit, label in enumerate(RULE_LABELS)
+        ]
 
         self.content = ft.Column(
             spacing=spacing.sm,
-            controls=[
-                ft.Text(
-                    "Sua senha deve conter:",
-                    style=body_primary,
-                    color=self._scheme.on_surface,
-                ),
-                self._rule_row(
-                    f"Entre {PASSWORD_MIN_LEN} e {PASSWORD_MAX_LEN} caracteres",
-                    AuthValidations.has_valid_length(pwd),
-                ),
-                self._rule_row("Letra maiúscula", any(c.isupper() for c in pwd)),
-                self._rule_row("Letra minúscula", any(c.islower() for c in pwd)),
-                self._rule_row("Pelo menos um número", AuthValidations.has_number(pwd)),
-                self._rule_row("Pelo menos um caractere especial\n""(exemplo: @ ! $ & #)", AuthValidations.has_symbol(pwd)),
-            ],
+            controls=[self._title, *rows],
         )
 
     def _rule_row(self, label: str, valid: bool) -> ft.Row:
-        return ft.Row(
-            spacing=spacing.sm,
-            controls=[
-                ft.Icon(
-                    ft.Icons.CHECK_CIRCLE if valid else ft.Icons.CANCEL,
-                    size=18,
-                    color=self._scheme.secondary if valid else self._scheme.outline,
-                ),
-                ft.Text(label, style=body_secondary, color=self._scheme.on_surface_variant),
-            ],
-        )
+        icon = ft.Icon(size=18)
+        text = ft.Text(label, style=body_secondary, color=self._scheme.on_surface_variant)
+        self._icons.append(icon)
+        self._labels.append(text)
+        self._paint_icon(icon, valid)
+        return ft.Row(spacing=spacing.sm, controls=[icon, text])
+
+    def _paint_icon(self, icon: ft.Icon, valid: bool) -> None:
+        tokens = tokens_for(self._scheme)
+        icon.name = ft.Icons.CHECK_CIRCLE if valid else ft.Icons.CANCEL
+        icon.color = tokens.rule_valid if valid else tokens.rule_invalid
 
     def update_password(self, password: str):
         self._password = password or ""
-        self._build()
-        self.update()
+        mask = self._rules.evaluate(self._password).mask
+        flipped = mask ^ self._mask
+        if not flipped:
+            return
+
+        self._mask = mask
+        for bit, icon in enumerate(self._icons):
+            if flipped & (1 << bit):
+                self._paint_icon(icon, bool(mask & (1 << bit)))
+                request_update(icon)
 
     def update_color_scheme(self, scheme: ft.ColorScheme):
         self._scheme = scheme
         self.bgcolor = scheme.surface_variant
-        self._build()
-        self.update()
+        self._title.color = scheme.on_surface
+        for bit, (icon, text) in enumerate(zip(self._icons, self._labels)):
+            text.color = scheme.on_surface_variant
+            self._paint_icon(icon, bool(self._mask & (1 << bit)))
+        request_update(self)
+
+    def update_theme(self, scheme: ft.ColorScheme):
+        self.update_color_scheme(scheme)
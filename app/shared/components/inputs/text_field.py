@@ -1,8 +1,11 @@
 import flet as ft
 from app.core.theme.theme_resolver import ThemeResolver
+from app.core.theme.themeable_registry import Themeable
+from app.core.theme.tokens import tokens_for
+from app.core.utils.update_scheduler import request_update
 
 
-class AppTextField(ft.TextField):
+class AppTextField(Themeable, ft.TextField):
     def __init__(
         self,
         page: ft.Page | None = None,
@@ -40,26 +43,22 @@ class AppTextField(ft.TextField):
                 on_click=self._toggle_password,
             )
 
-        if page is not None:
-            if not hasattr(page, "_textfields"):
-                page._textfields = []
-            page._textfields.append(self)
-
     def _apply_theme(self):
         scheme = self._scheme
+        tokens = tokens_for(scheme)
 
-        self.border_color = scheme.outline + "88"
+        self.border_color = tokens.border_subtle
         self.focused_border_color = scheme.primary
         self.cursor_color = scheme.primary
 
-        self.text_style = ft.TextStyle(color=scheme.on_surface_variant)
-        self.label_style = ft.TextStyle(color=scheme.on_surface_variant)
-        self.floating_label_style = ft.TextStyle(color=scheme.primary)
-        self.hint_style = ft.TextStyle(color=scheme.on_surface_variant + "AA")
+        self.text_style = tokens.input_text
+        self.label_style = tokens.input_label
+        self.floating_label_style = tokens.input_floating_label
+        self.hint_style = tokens.input_hint
 
         self.prefix_icon_color = scheme.on_surface_variant
         self.suffix_icon_color = scheme.on_surface_variant
-        self.error_style = ft.TextStyle(color=scheme.error)
+        self.error_style = tokens.input_error
 
     def _toggle_password(self, e: ft.ControlEvent):
         self._is_password = not self._is_password
@@ -67,7 +66,7 @@ class AppTextField(ft.TextField):
         self.suffix_icon.icon = (
             ft.Icons.VISIBILITY_OFF if self._is_password else ft.Icons.VISIBILITY
         )
-        e.page.update()
+        request_update(self)
 
     def set_error(self, message: str):
         self.error_text = message
@@ -78,4 +77,4 @@ class AppTextField(ft.TextField):
     def update_theme(self, scheme: ft.ColorScheme):
         self._scheme = scheme
         self._apply_theme()
-        self.update()
+        request_update(self)
@@ -1,6 +1,9 @@
 import flet as ft
 from app.core.navigation.routes import Routes
 from app.core.theme.theme_resolver import ThemeResolver
+from app.core.theme.themeable_registry import Themeable
+from app.core.theme import tokens
+from app.core.utils.update_scheduler import request_update
 
 class NavButton(ft.Container):
     def __init__(self, icon: str, active_icon: str, label: str, route: str, page: ft.Page):
@@ -25,9 +28,9 @@ class NavButton(ft.Container):
             content=ft.Icon(
                 name=icon, 
                 size=24,
-                animate_scale=ft.Animation(300, ft.AnimationCurve.DECELERATE)
+                animate_scale=tokens.animation_fast
             ),
-            animate=ft.Animation(300, ft.AnimationCurve.DECELERATE),
+            animate=tokens.animation_fast,
         )
         
         self.text_control = ft.Text(
@@ -62,10 +65,8 @@ class NavButton(ft.Container):
         self.text_control.color = active_color if is_active else inactive_color
         self.text_control.weight = ft.FontWeight.W_200 if is_active else ft.FontWeight.W_200
         self.text_control.opacity = 1.0 if is_active else 0.8
-        
-        self.update()
 
-class CustomBottomNavbar(ft.Container):
+class CustomBottomNavbar(Themeable, ft.Container):
     def __init__(self, page: ft.Page):
         self.page = page
         scheme = ThemeResolver.get_scheme(page)
@@ -85,21 +86,31 @@ class CustomBottomNavbar(ft.Container):
             ),
             bgcolor=scheme.surface,
             height=85,
-            shadow=ft.BoxShadow(
-                spread_radius=1,
-                blur_radius=10,
-                color=ft.Colors.with_opacity(0.05, ft.Colors.BLACK),
-                offset=ft.Offset(0, -2)
-            ),
+            shadow=tokens.navbar_shadow,
             padding=ft.padding.only(bottom=15, left=10, right=10),
             offset=ft.Offset(0, 0),
-            animate_offset=ft.Animation(600, ft.AnimationCurve.DECELERATE),
+            animate_offset=tokens.animation_slow,
         )
+        self._active_route: str | None = None
+        self._scheme: ft.ColorScheme | None = None
+
+    def update_state(self) -> bool:
+        """Aplica rota ativa e cores; devolve False (sem tocar em nada) quando nada mudou.
 
-    def update_state(self):
+        Não envia nada ao cliente: quem chama decide quando atualizar a barra.
+        """
         scheme = ThemeResolver.get_scheme(self.page)
+        route = self.page.route
+        if route == self._active_route and scheme is self._scheme:
+            return False
+
+        self._active_route = route
+        self._scheme = scheme
         self.bgcolor = scheme.surface
-            
         for btn in self.buttons:
-            btn.update_style(self.page.route, scheme)
-        self.update()
\ No newline at end of file
+            btn.update_style(route, scheme)
+        return True
+
+    def update_theme(self, scheme: ft.ColorScheme):
+        if self.update_state():
+            request_update(self)
@@ -0,0 +1,103 @@
+import gzip
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # dependência opcional
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # dependência opcional
+    msgspec = None
+
+try:
+    import brotli
+except ImportError:  # dependência opcional
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+
+# ─────────────────────────────
+# JSON
+# ─────────────────────────────
+
+class JsonCodec:
+    name = "json"
+    content_type = "application/json"
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def encode(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def decode(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as exc:
+            # Mantém o contrato do json.loads (ValueError em payload inválido)
+            raise ValueError(str(exc)) from exc
+
+
+def get_default_codec() -> JsonCodec:
+    if orjson is not None:
+        return OrjsonCodec()
+    if msgspec is not None:
+        return MsgspecCodec()
+    return JsonCodec()
+
+
+# ─────────────────────────────
+# COMPRESSÃO
+# ─────────────────────────────
+
+COMPRESSION_THRESHOLD = 1024
+
+
+def supported_encodings() -> list[str]:
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def accept_encoding() -> str:
+    return ", ".join(supported_encodings())
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(data, quality=5)
+    raise ValueError(f"Codificação não suportada: {encoding}")
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(data)
+    raise ValueError(f"Codificação não suportada: {encoding}")
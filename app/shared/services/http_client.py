@@ -1,4 +1,11 @@
+import asyncio
+import os
+import threading
+import time
+
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.core.errors.exceptions import (
     AppException,
@@ -8,66 +15,465 @@ from app.core.errors.exceptions import (
     NotFoundError,
     UnprocessableEntityError,
     ServerError,
+    ServiceUnavailableError,
     UnknownError,
     ValidationError,
 )
+from app.shared.services.codecs import (
+    COMPRESSION_THRESHOLD,
+    JsonCodec,
+    accept_encoding,
+    compress,
+    get_default_codec,
+)
+from app.shared.services.http_metrics import HttpMetrics, Observation, http_metrics
+from app.shared.services.http_policy import (
+    CircuitBreaker,
+    EndpointPolicies,
+    RetryPolicy,
+    default_policies,
+)
+from app.shared.services.load_balancer import BackendNode, LoadBalancer, backend_urls_from_env
+from app.shared.services.response_cache import CacheEntry, DiskCacheTier, ResponseCache, cache_key
+from app.shared.services.single_flight import SingleFlight, request_key
 
 
 class HttpClient:
     BASE_URL = "http://127.0.0.1:8000"
+    TIMEOUT = 10
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        *,
+        load_balancer: LoadBalancer | None = None,
+        pool_connections: int = 4,
+        pool_maxsize: int = 16,
+        timeout: float | None = None,
+        policies: EndpointPolicies | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        cache: ResponseCache | None = None,
+        metrics: HttpMetrics | None = None,
+        codec: JsonCodec | None = None,
+        request_encoding: str | None = "gzip",
+        compression_threshold: int = COMPRESSION_THRESHOLD,
+    ):
+        self.load_balancer = load_balancer or LoadBalancer([base_url or self.BASE_URL])
+        self.base_url = self.load_balancer.nodes[0].url
+        self.timeout = timeout or self.TIMEOUT
+        self.policies = policies or default_policies()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.cache = cache or ResponseCache()
+        self.metrics = metrics or http_metrics
+        self.codec = codec or get_default_codec()
+        self.request_encoding = request_encoding
+        self.compression_threshold = compression_threshold
+        self._pool_maxsize = pool_maxsize
+        self._single_flight = SingleFlight()
+
+        # Definido pelo TokenManager da sessão (header Authorization + refresh)
+        self.token_manager = None
+
+        # Sessão única com keep-alive: reaproveita conexões TCP entre chamadas
+        adapter = HTTPAdapter(
+            pool_connections=max(pool_connections, len(self.load_balancer.nodes)),
+            pool_maxsize=pool_maxsize,
+            max_retries=0,
+        )
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Accept-Encoding"] = accept_encoding()
+
+        # Cliente assíncrono criado sob demanda (handlers async do Flet)
+        self._async_client: httpx.AsyncClient | None = None
+
+    # ─────────────────────────────
+    # SYNC
+    # ─────────────────────────────
+
+    def get(self, path: str, *, params: dict | None = None, ttl: float | None = None, use_cache: bool = True):
+        key = cache_key(path, params)
+        entry = self.cache.get(key) if use_cache else None
+        if entry is not None and entry.is_fresh:
+            return entry.body
+
+        headers = entry.conditional_headers() if entry else None
+
+        def fetch():
+            with self.metrics.observe("GET", path) as observation:
+                response = self._send("GET", path, params=params, headers=headers, observation=observation)
+                return self._cache_response(key, entry, ttl, use_cache, response)
+
+        return self._single_flight.do(request_key("GET", key), fetch)
+
+    def post(self, path: str, *, json: dict, idempotency_key: str | None = None):
+        headers = self._idempotency_headers(idempotency_key)
+
+        def send():
+            with self.metrics.observe("POST", path) as observation:
+                response = self._send("POST", path, body=json, headers=headers, observation=observation)
+                return self._invalidating(path, self._handle_response(response))
+
+        return self._single_flight.do(request_key("POST", path, json), send)
+
+    def _send(self, method: str, path: str, *, params=None, body=None, headers=None, observation=None):
+        if self._should_refresh_token(path):
+            self.token_manager.ensure_fresh()
+
+        policy = self.policies.for_endpoint(method, path)
+        headers = self._auth_headers(headers)
+        content, headers = self._encode_body(body, headers)
+        observation = observation or Observation()
+        observation.bytes_out = len(content or b"")
+        attempt = 0
 
-    def post(self, path: str, *, json: dict):
         try:
-            response = requests.post(
-                f"{self.BASE_URL}{path}",
-                json=json,
-                timeout=10,
-            )
-    
-            status = response.status_code
-    
-            if status == 400:
-                raise ValidationError(response.text)
-    
-            if status == 401:
-                raise UnauthorizedError()
-    
-            if status == 403:
-                raise AccessDeniedError()
-    
-            if status == 404:
-                raise NotFoundError()
-    
-            if status == 422:
-                raise UnprocessableEntityError(response.text)
-    
-            if status == 429:
-                raise AccessDeniedError()
-    
-            if 500 <= status <= 599:
-                raise ServerError()
-    
-            if not response.ok:
-                raise UnknownError(response.text)
-            if not response.content:
-                return {}
-    
-            content_type = response.headers.get("Content-Type", "")
-    
-            if "application/json" in content_type:
+            while True:
+                attempt += 1
+                self._check_circuit()
+
+                # Toda tentativa liberada pelo breaker termina em sucesso ou falha
+                # registrada, senão a sonda do half-open fica presa
+                recorded = False
                 try:
-                    return response.json()
-                except ValueError:
-                    return {}
-    
-            return {}
-    
-        except requests.ConnectionError:
-            raise NetworkError()
-    
+                    try:
+                        with self.load_balancer.acquire() as node:
+                            response = self._session.request(
+                                method,
+                                f"{node.url}{path}",
+                                params=params,
+                                data=content,
+                                headers=headers,
+                                timeout=self.timeout,
+                            )
+                    except (requests.ConnectionError, requests.Timeout):
+                        self.load_balancer.report_failure(node)
+                        self.circuit_breaker.record_failure()
+                        recorded = True
+                        delay = policy.retry_delay(attempt)
+                        if delay is None:
+                            raise NetworkError()
+                        time.sleep(delay)
+                        continue
+
+                    delay = self._record_outcome(policy, attempt, response, observation, node)
+                    recorded = True
+                finally:
+                    if not recorded:
+                        self.circuit_breaker.record_failure()
+
+                if delay is None:
+                    return response
+                time.sleep(delay)
+
         except AppException:
             raise
-        
+
         except Exception as exc:
             raise UnknownError() from exc
-    
\ No newline at end of file
+
+    # ─────────────────────────────
+    # ASYNC
+    # ─────────────────────────────
+
+    async def get_async(
+        self,
+        path: str,
+        *,
+        params: dict | None = None,
+        ttl: float | None = None,
+        use_cache: bool = True,
+    ):
+        key = cache_key(path, params)
+        entry = self.cache.get(key) if use_cache else None
+        if entry is not None and entry.is_fresh:
+            return entry.body
+
+        headers = entry.conditional_headers() if entry else None
+
+        async def fetch():
+            with self.metrics.observe("GET", path) as observation:
+                response = await self._send_async(
+                    "GET", path, params=params, headers=headers, observation=observation
+                )
+                return self._cache_response(key, entry, ttl, use_cache, response)
+
+        return await self._single_flight.do_async(request_key("GET", key), fetch)
+
+    async def post_async(self, path: str, *, json: dict, idempotency_key: str | None = None):
+        headers = self._idempotency_headers(idempotency_key)
+
+        async def send():
+            with self.metrics.observe("POST", path) as observation:
+                response = await self._send_async(
+                    "POST", path, body=json, headers=headers, observation=observation
+                )
+                return self._invalidating(path, self._handle_response(response))
+
+        return await self._single_flight.do_async(request_key("POST", path, json), send)
+
+    async def _send_async(self, method: str, path: str, *, params=None, body=None, headers=None, observation=None):
+        if self._should_refresh_token(path):
+            await self.token_manager.ensure_fresh_async()
+
+        policy = self.policies.for_endpoint(method, path)
+        headers = self._auth_headers(headers)
+        content, headers = self._encode_body(body, headers)
+        observation = observation or Observation()
+        observation.bytes_out = len(content or b"")
+        attempt = 0
+
+        try:
+            while True:
+                attempt += 1
+                self._check_circuit()
+
+                recorded = False
+                try:
+                    try:
+                        with self.load_balancer.acquire() as node:
+                            response = await self._get_async_client().request(
+                                method,
+                                f"{node.url}{path}",
+                                params=params,
+                                content=content,
+                                headers=headers,
+                            )
+                    except httpx.TransportError:
+                        self.load_balancer.report_failure(node)
+                        self.circuit_breaker.record_failure()
+                        recorded = True
+                        delay = policy.retry_delay(attempt)
+                        if delay is None:
+                            raise NetworkError()
+                        await asyncio.sleep(delay)
+                        continue
+
+                    delay = self._record_outcome(policy, attempt, response, observation, node)
+                    recorded = True
+                finally:
+                    # Inclui cancelamento (CancelledError) e erros inesperados
+                    if not recorded:
+                        self.circuit_breaker.record_failure()
+
+                if delay is None:
+                    return response
+                await asyncio.sleep(delay)
+
+        except AppException:
+            raise
+
+        except Exception as exc:
+            raise UnknownError() from exc
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers={"Accept-Encoding": accept_encoding()},
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self._pool_maxsize,
+                    max_keepalive_connections=self._pool_maxsize,
+                ),
+            )
+        return self._async_client
+
+    # ─────────────────────────────
+    # CACHE (comum a sync e async)
+    # ─────────────────────────────
+
+    def invalidate(self, path_prefix: str) -> None:
+        self.cache.invalidate(path_prefix)
+
+    def _invalidating(self, path: str, body):
+        # Escrita bem-sucedida torna obsoletas as leituras da mesma rota
+        self.cache.invalidate(path)
+        return body
+
+    def _cache_response(self, key: str, entry: CacheEntry | None, ttl: float | None, use_cache: bool, response):
+        if response.status_code == 304 and entry is not None:
+            entry.expires_at = time.time() + self._response_ttl(key, ttl, response)
+            self.cache.set(key, entry)
+            return entry.body
+
+        body = self._handle_response(response)
+        if not use_cache or "no-store" in response.headers.get("Cache-Control", ""):
+            return body
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        ttl = self._response_ttl(key, ttl, response)
+        if ttl > 0 or etag or last_modified:
+            self.cache.set(key, CacheEntry(body, time.time() + ttl, etag, last_modified))
+        return body
+
+    def _response_ttl(self, key: str, ttl: float | None, response) -> float:
+        if ttl is not None:
+            return ttl
+        for directive in response.headers.get("Cache-Control", "").split(","):
+            name, _, value = directive.strip().partition("=")
+            if name == "max-age" and value.isdigit():
+                return float(value)
+            if name == "no-cache":
+                return 0.0
+        return self.cache.ttl_for(key)
+
+    # ─────────────────────────────
+    # POLÍTICAS (comum a sync e async)
+    # ─────────────────────────────
+
+    @staticmethod
+    def _idempotency_headers(idempotency_key: str | None) -> dict | None:
+        if not idempotency_key:
+            return None
+        return {"Idempotency-Key": idempotency_key}
+
+    def _check_circuit(self) -> None:
+        if not self.circuit_breaker.allow_request():
+            raise ServiceUnavailableError()
+
+    def _record_outcome(
+        self,
+        policy: RetryPolicy,
+        attempt: int,
+        response,
+        observation: Observation,
+        node: BackendNode,
+    ) -> float | None:
+        """Atualiza breaker, balanceador e métricas e devolve o atraso do próximo retry, se houver."""
+        status = response.status_code
+        observation.status = status
+        observation.bytes_in += int(response.headers.get("Content-Length") or len(response.content))
+        if status >= 500:
+            self.load_balancer.report_failure(node)
+            self.circuit_breaker.record_failure()
+        else:
+            self.load_balancer.report_success(node)
+            self.circuit_breaker.record_success()
+
+        if status not in policy.retry_statuses:
+            return None
+        return policy.retry_delay(attempt, status, response.headers.get("Retry-After"))
+
+    # ─────────────────────────────
+    # RESPOSTA (comum a sync e async)
+    # ─────────────────────────────
+
+    def _handle_response(self, response):
+        status = response.status_code
+
+        if status == 400:
+            raise ValidationError(response.text)
+
+        if status == 401:
+            raise UnauthorizedError()
+
+        if status == 403:
+            raise AccessDeniedError()
+
+        if status == 404:
+            raise NotFoundError()
+
+        if status == 422:
+            raise UnprocessableEntityError(response.text)
+
+        if status == 429:
+            raise AccessDeniedError()
+
+        if 500 <= status <= 599:
+            raise ServerError()
+
+        if status >= 400:
+            raise UnknownError(response.text)
+        if not response.content:
+            return {}
+
+        content_type = response.headers.get("Content-Type", "")
+
+        if "application/json" in content_type:
+            try:
+                return self.codec.decode(response.content)
+            except ValueError:
+                return {}
+
+        return {}
+
+    # ─────────────────────────────
+    # AUTENTICAÇÃO (comum a sync e async)
+    # ─────────────────────────────
+
+    def _should_refresh_token(self, path: str) -> bool:
+        return self.token_manager is not None and path != self.token_manager.REFRESH_PATH
+
+    def _auth_headers(self, headers: dict | None) -> dict | None:
+        if self.token_manager is None:
+            return headers
+        auth = self.token_manager.authorization_header()
+        return {**auth, **(headers or {})} if auth else headers
+
+    # ─────────────────────────────
+    # CODEC (comum a sync e async)
+    # ─────────────────────────────
+
+    def _encode_body(self, body, headers: dict | None) -> tuple[bytes | None, dict | None]:
+        if body is None:
+            return None, headers
+
+        content = self.codec.encode(body)
+        headers = {**(headers or {}), "Content-Type": self.codec.content_type}
+
+        if self.request_encoding and len(content) >= self.compression_threshold:
+            content = compress(content, self.request_encoding)
+            headers["Content-Encoding"] = self.request_encoding
+
+        return content, headers
+
+    # ─────────────────────────────
+    # CICLO DE VIDA
+    # ─────────────────────────────
+
+    def close(self) -> None:
+        self._session.close()
+
+    async def aclose(self) -> None:
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def get_http_client(page) -> HttpClient:
+    """Cliente HTTP compartilhado por todos os serviços da sessão Flet."""
+    client = getattr(page, "http_client", None)
+    if client is None:
+        # Cache em disco só quando explicitamente configurado (modo desktop)
+        cache_dir = os.environ.get("VIMI42_HTTP_CACHE_DIR")
+        disk = DiskCacheTier(cache_dir) if cache_dir else None
+        client = HttpClient(load_balancer=shared_load_balancer(), cache=ResponseCache(disk=disk))
+        page.http_client = client
+    return client
+
+
+_load_balancer: LoadBalancer | None = None
+_load_balancer_lock = threading.Lock()
+
+
+def shared_load_balancer() -> LoadBalancer:
+    """Balanceador do processo: contagem de requisições e saúde valem para todas as sessões."""
+    global _load_balancer
+    with _load_balancer_lock:
+        if _load_balancer is None:
+            _load_balancer = LoadBalancer(backend_urls_from_env(HttpClient.BASE_URL))
+            _load_balancer.start_health_checks(_probe_health)
+        return _load_balancer
+
+
+def _probe_health(url: str) -> bool:
+    return requests.get(f"{url}/health", timeout=2).ok
@@ -0,0 +1,171 @@
+import atexit
+import json
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class Observation:
+    status: int | None = None
+    bytes_in: int = 0
+    bytes_out: int = 0
+    error: str | None = None
+
+
+@dataclass
+class EndpointStats:
+    sample_size: int
+    count: int = 0
+    latency_sum: float = 0.0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    samples: deque = field(init=False)
+
+    def __post_init__(self):
+        # Janela das últimas N latências para p50/p95/p99
+        self.samples = deque(maxlen=self.sample_size)
+
+    def add(self, seconds: float, observation: Observation) -> None:
+        self.count += 1
+        self.latency_sum += seconds
+        self.samples.append(seconds)
+        self.bytes_in += observation.bytes_in
+        self.bytes_out += observation.bytes_out
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+        if observation.status is not None:
+            self.statuses[observation.status] += 1
+        if observation.error:
+            self.errors[observation.error] += 1
+
+    def percentile(self, q: float) -> float | None:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class HttpMetrics:
+    def __init__(self, sample_size: int = 1024):
+        self.sample_size = sample_size
+        self._stats: dict[tuple[str, str], EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def observe(self, method: str, path: str):
+        observation = Observation()
+        start = time.perf_counter()
+        try:
+            yield observation
+        except BaseException as exc:
+            observation.error = type(exc).__name__
+            raise
+        finally:
+            self.record(method, path, time.perf_counter() - start, observation)
+
+    def record(self, method: str, path: str, seconds: float, observation: Observation) -> None:
+        key = (method.upper(), path)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EndpointStats(self.sample_size)
+            stats.add(seconds, observation)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    # ─────────────────────────────
+    # LEITURA / EXPORTAÇÃO
+    # ─────────────────────────────
+
+    def snapshot(self) -> list[dict]:
+        with self._lock:
+            return [
+                {
+                    "method": method,
+                    "path": path,
+                    "count": stats.count,
+                    "p50": stats.percentile(0.50),
+                    "p95": stats.percentile(0.95),
+                    "p99": stats.percentile(0.99),
+                    "latency_sum": stats.latency_sum,
+                    "statuses": {str(k): v for k, v in stats.statuses.items()},
+                    "errors": dict(stats.errors),
+                    "bytes_in": stats.bytes_in,
+                    "bytes_out": stats.bytes_out,
+                }
+                for (method, path), stats in self._stats.items()
+            ]
+
+    def export_jsonl(self, file_path: str) -> None:
+        timestamp = time.time()
+        with open(file_path, "a", encoding="utf-8") as fp:
+            for entry in self.snapshot():
+                fp.write(json.dumps({"ts": timestamp, **entry}) + "\n")
+
+    def to_prometheus(self, prefix: str = "vimi42_http") -> str:
+        lines = [
+            f"# HELP {prefix}_request_duration_seconds Latência das requisições vista pelo frontend.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            items = list(self._stats.items())
+
+            for (method, path), stats in items:
+                labels = f'method="{method}",path="{path}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                    cumulative += count
+                    lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.count}')
+                lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {stats.latency_sum}")
+                lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {stats.count}")
+
+            lines.append(f"# TYPE {prefix}_responses_total counter")
+            for (method, path), stats in items:
+                for status, count in stats.statuses.items():
+                    lines.append(f'{prefix}_responses_total{{method="{method}",path="{path}",status="{status}"}} {count}')
+
+            lines.append(f"# TYPE {prefix}_errors_total counter")
+            for (method, path), stats in items:
+                for error, count in stats.errors.items():
+                    lines.append(f'{prefix}_errors_total{{method="{method}",path="{path}",exception="{error}"}} {count}')
+
+            for name, attr in (("bytes_sent_total", "bytes_out"), ("bytes_received_total", "bytes_in")):
+                lines.append(f"# TYPE {prefix}_{name} counter")
+                for (method, path), stats in items:
+                    lines.append(f'{prefix}_{name}{{method="{method}",path="{path}"}} {getattr(stats, attr)}')
+
+        return "\n".join(lines) + "\n"
+
+
+# Métricas do processo (somam todas as sessões)
+http_metrics = HttpMetrics()
+
+_exports_at_exit: set[str] = set()
+_exports_lock = threading.Lock()
+
+
+def export_at_exit(file_path: str, metrics: HttpMetrics = http_metrics) -> None:
+    """Agenda um único export do snapshot do processo para o encerramento.
+
+    As métricas são globais e cumulativas: exportar a cada sessão gravaria
+    cópias sobrepostas dos mesmos contadores. Chamadas repetidas são ignoradas.
+    """
+    with _exports_lock:
+        if file_path in _exports_at_exit:
+            return
+        _exports_at_exit.add(file_path)
+    atexit.register(metrics.export_jsonl, file_path)
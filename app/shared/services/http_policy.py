@@ -0,0 +1,162 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Callable
+
+
+# ─────────────────────────────
+# RETRY
+# ─────────────────────────────
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 1
+    base_delay: float = 0.25
+    max_delay: float = 4.0
+    max_retry_after: float = 10.0
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    idempotent: bool = False
+
+    def can_retry(self, attempt: int) -> bool:
+        return self.idempotent and attempt < self.max_attempts
+
+    def backoff(self, attempt: int) -> float:
+        # Exponencial com "full jitter": espalha os clientes no tempo
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def retry_delay(self, attempt: int, status: int | None = None, retry_after: str | None = None) -> float | None:
+        """Atraso até a próxima tentativa, ou None quando não deve haver retry."""
+        if not self.can_retry(attempt):
+            return None
+
+        if status is not None and status not in self.retry_statuses:
+            return None
+
+        if status in (429, 503) and retry_after:
+            delay = parse_retry_after(retry_after)
+            if delay is not None:
+                return delay if delay <= self.max_retry_after else None
+
+        return self.backoff(attempt)
+
+
+def parse_retry_after(value: str) -> float | None:
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+NO_RETRY = RetryPolicy()
+IDEMPOTENT_RETRY = RetryPolicy(max_attempts=3, idempotent=True)
+
+
+class EndpointPolicies:
+    def __init__(
+        self,
+        policies: dict[tuple[str, str], RetryPolicy] | None = None,
+        defaults: dict[str, RetryPolicy] | None = None,
+    ):
+        self._policies = dict(policies or {})
+        self._defaults = {"GET": IDEMPOTENT_RETRY, **(defaults or {})}
+
+    def set(self, method: str, path: str, policy: RetryPolicy) -> None:
+        self._policies[(method.upper(), path)] = policy
+
+    def for_endpoint(self, method: str, path: str) -> RetryPolicy:
+        method = method.upper()
+        return self._policies.get((method, path)) or self._defaults.get(method, NO_RETRY)
+
+
+def default_policies() -> EndpointPolicies:
+    # Somente chamadas sem efeito colateral são repetidas automaticamente.
+    # Cadastro, envio de e-mail e troca de senha nunca são reenviados.
+    return EndpointPolicies({
+        ("POST", "/auth/login"): IDEMPOTENT_RETRY,
+        ("POST", "/auth/validate-reset-token"): IDEMPOTENT_RETRY,
+    })
+
+
+# ─────────────────────────────
+# CIRCUIT BREAKER
+# ─────────────────────────────
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreaker:
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+    _state: CircuitState = field(default=CircuitState.CLOSED, init=False)
+    _failures: int = field(default=0, init=False)
+    _opened_at: float = field(default=0.0, init=False)
+    _probe_in_flight: bool = field(default=False, init=False)
+    _listeners: list[Callable[[CircuitState], None]] = field(default_factory=list, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+
+    def subscribe(self, callback: Callable[[CircuitState], None]) -> None:
+        self._listeners.append(callback)
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+                # Deixa passar uma única requisição de teste
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        self._transition(CircuitState.CLOSED, reset=True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            should_open = (
+                self._current_state() == CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            )
+        if should_open:
+            self._transition(CircuitState.OPEN)
+
+    def _current_state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def _transition(self, state: CircuitState, reset: bool = False) -> None:
+        with self._lock:
+            changed = self._state != state
+            self._state = state
+            self._probe_in_flight = False
+            if reset:
+                self._failures = 0
+            if state == CircuitState.OPEN:
+                self._opened_at = time.monotonic()
+
+        if changed:
+            for callback in list(self._listeners):
+                callback(state)
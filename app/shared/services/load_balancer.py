@@ -0,0 +1,132 @@
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+
+def backend_urls_from_env(default: str) -> list[str]:
+    """Lê VIMI42_API_URLS (separadas por vírgula); cai no BASE_URL padrão."""
+    raw = os.environ.get("VIMI42_API_URLS", "")
+    urls = [url.strip().rstrip("/") for url in raw.split(",") if url.strip()]
+    return urls or [default]
+
+
+@dataclass
+class BackendNode:
+    url: str
+    outstanding: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+
+    def is_available(self, now: float) -> bool:
+        return now >= self.ejected_until
+
+
+class LoadBalancer:
+    STRATEGIES = ("p2c", "least_outstanding")
+
+    def __init__(
+        self,
+        urls: list[str],
+        *,
+        strategy: str = "p2c",
+        eject_after: int = 3,
+        eject_for: float = 30.0,
+    ):
+        if not urls:
+            raise ValueError("Informe ao menos um backend")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Estratégia desconhecida: {strategy}")
+
+        self.nodes = [BackendNode(url.rstrip("/")) for url in urls]
+        self.strategy = strategy
+        self.eject_after = eject_after
+        self.eject_for = eject_for
+        self._lock = threading.Lock()
+        self._health_thread: threading.Thread | None = None
+        self._stop_health = threading.Event()
+
+    # ─────────────────────────────
+    # SELEÇÃO
+    # ─────────────────────────────
+
+    def pick(self) -> BackendNode:
+        with self._lock:
+            return self._pick_locked()
+
+    @contextmanager
+    def acquire(self) -> Iterator[BackendNode]:
+        with self._lock:
+            node = self._pick_locked()
+            node.outstanding += 1
+        try:
+            yield node
+        finally:
+            with self._lock:
+                node.outstanding -= 1
+
+    def _pick_locked(self) -> BackendNode:
+        if len(self.nodes) == 1:
+            return self.nodes[0]
+
+        now = time.monotonic()
+        candidates = [node for node in self.nodes if node.is_available(now)]
+        if not candidates:
+            # Todos ejetados: tenta o que volta primeiro em vez de falhar
+            return min(self.nodes, key=lambda node: node.ejected_until)
+
+        if self.strategy == "p2c" and len(candidates) > 2:
+            candidates = random.sample(candidates, 2)
+        return min(candidates, key=lambda node: node.outstanding)
+
+    # ─────────────────────────────
+    # SAÚDE (passiva)
+    # ─────────────────────────────
+
+    def report_success(self, node: BackendNode) -> None:
+        with self._lock:
+            node.consecutive_failures = 0
+            node.ejected_until = 0.0
+
+    def report_failure(self, node: BackendNode) -> None:
+        with self._lock:
+            node.consecutive_failures += 1
+            if node.consecutive_failures >= self.eject_after:
+                node.ejected_until = time.monotonic() + self.eject_for
+
+    # ─────────────────────────────
+    # SAÚDE (ativa)
+    # ─────────────────────────────
+
+    def check_health(self, probe: Callable[[str], bool]) -> None:
+        for node in self.nodes:
+            try:
+                healthy = probe(node.url)
+            except Exception:
+                healthy = False
+
+            with self._lock:
+                if healthy:
+                    node.consecutive_failures = 0
+                    node.ejected_until = 0.0
+                else:
+                    node.consecutive_failures = max(node.consecutive_failures, self.eject_after)
+                    node.ejected_until = time.monotonic() + self.eject_for
+
+    def start_health_checks(self, probe: Callable[[str], bool], interval: float = 10.0) -> None:
+        if self._health_thread is not None or len(self.nodes) < 2:
+            return
+
+        def loop():
+            while not self._stop_health.wait(interval):
+                self.check_health(probe)
+
+        self._health_thread = threading.Thread(target=loop, name="backend-health", daemon=True)
+        self._health_thread.start()
+
+    def stop_health_checks(self) -> None:
+        self._stop_health.set()
+        self._health_thread = None
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any
+from urllib.parse import urlencode
+
+
+def cache_key(path: str, params: dict | None = None) -> str:
+    if not params:
+        return path
+    return f"{path}?{urlencode(sorted(params.items()), doseq=True)}"
+
+
+@dataclass
+class CacheEntry:
+    body: Any
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DiskCacheTier:
+    """Segundo nível em disco para warm start.
+
+    Use apenas em modo desktop (um usuário por processo): o diretório não é
+    separado por sessão.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _file(self, key: str) -> str:
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{name}.json")
+
+    def load(self, key: str) -> CacheEntry | None:
+        try:
+            with open(self._file(key), encoding="utf-8") as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        if data.get("key") != key:
+            return None
+        return CacheEntry(**data["entry"])
+
+    def store(self, key: str, entry: CacheEntry) -> None:
+        try:
+            with open(self._file(key), "w", encoding="utf-8") as fp:
+                json.dump({"key": key, "entry": asdict(entry)}, fp)
+        except (OSError, TypeError):
+            pass
+
+    def invalidate(self, prefix: str) -> None:
+        for name in os.listdir(self.directory):
+            file = os.path.join(self.directory, name)
+            try:
+                with open(file, encoding="utf-8") as fp:
+                    key = json.load(fp).get("key", "")
+                if key.startswith(prefix):
+                    os.remove(file)
+            except (OSError, ValueError):
+                continue
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int = 256,
+        default_ttl: float = 30.0,
+        route_ttls: dict[str, float] | None = None,
+        disk: DiskCacheTier | None = None,
+    ):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.route_ttls = dict(route_ttls or {})
+        self.disk = disk
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, key: str) -> float:
+        for prefix, ttl in self.route_ttls.items():
+            if key.startswith(prefix):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        if self.disk is not None:
+            entry = self.disk.load(key)
+            if entry is not None:
+                self._put(key, entry)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self._put(key, entry)
+        if self.disk is not None:
+            self.disk.store(key, entry)
+
+    def invalidate(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+        if self.disk is not None:
+            self.disk.invalidate(prefix)
+
+    def clear(self) -> None:
+        self.invalidate("")
+
+    def _put(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
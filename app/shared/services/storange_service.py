@@ -1,15 +1,189 @@
+import asyncio
+import json
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Iterable
+
 import flet as ft
 
 
+_MISSING = object()
+
+
 class StorageService:
+    """Cache write-through da sessão na frente do client_storage.
+
+    Todos os valores ficam em um único namespace JSON: uma leitura hidrata a
+    sessão inteira e cada escrita (ou lote de escritas) custa uma releitura e
+    uma gravação do namespace, independente do número de chaves.
+
+    O localStorage é compartilhado entre abas, então a gravação não regrava o
+    cache da sessão: relê o namespace, aplica só as chaves alteradas aqui e
+    grava o resultado. O que outra aba salvou em outra chave é preservado.
+    """
+
+    NAMESPACE = "vimi42"
+
     def __init__(self, page: ft.Page):
         self._storage = page.client_storage
+        self._cache: dict[str, Any] | None = None
+        self._pending: dict[str, Any] = {}
+        self._lock = threading.RLock()
+        # Serializa releitura + merge + gravação; o I/O nunca segura _lock
+        self._io_lock = threading.Lock()
+        self._batch_depth = 0
+
+    # ─────────────────────────────
+    # LEITURA
+    # ─────────────────────────────
+
+    def hydrate(self) -> None:
+        """Carrega o namespace inteiro com uma única leitura do browser."""
+        with self._io_lock:
+            stored = self._read()
+            self._merge(stored)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values().get(key, default)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        values = self._values()
+        return {key: values.get(key) for key in keys}
+
+    # ─────────────────────────────
+    # ESCRITA
+    # ─────────────────────────────
+
+    def set(self, key: str, value: Any) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, values: dict[str, Any]) -> None:
+        self._values()
+        with self._lock:
+            self._cache.update(values)
+            self._pending.update(values)
+        self._flush()
+
+    def remove(self, *keys: str) -> None:
+        self._values()
+        with self._lock:
+            for key in keys:
+                self._cache.pop(key, None)
+                self._pending[key] = _MISSING
+        self._flush()
+
+    @contextmanager
+    def batch(self):
+        """Agrupa várias escritas em uma única gravação do namespace no final."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+            self._flush()
+
+    # ─────────────────────────────
+    # ASYNC
+    # ─────────────────────────────
+    # O client_storage síncrono espera a resposta do browser bloqueando a
+    # thread; no loop do Flet essa resposta nunca chega. Nos handlers async
+    # o I/O vai para uma thread, como nos handlers síncronos.
+
+    async def get_async(self, key: str, default: Any = None) -> Any:
+        if self._cache is None:
+            await asyncio.to_thread(self.hydrate)
+        return self.get(key, default)
+
+    async def set_async(self, key: str, value: Any) -> None:
+        await asyncio.to_thread(self.set, key, value)
+
+    async def set_many_async(self, values: dict[str, Any]) -> None:
+        await asyncio.to_thread(self.set_many, values)
+
+    async def remove_async(self, *keys: str) -> None:
+        await asyncio.to_thread(self.remove, *keys)
+
+    @asynccontextmanager
+    async def batch_async(self):
+        """`batch()` para handlers async: dentro do bloco set/remove só mexem na memória."""
+        if self._cache is None:
+            await asyncio.to_thread(self.hydrate)
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+            await asyncio.to_thread(self._flush)
+
+    # ─────────────────────────────
+    # TOKEN
+    # ─────────────────────────────
 
     def set_token(self, token: str) -> None:
-        self._storage.set("auth_token", token)
+        self.set("auth_token", token)
 
     def get_token(self) -> str | None:
-        return self._storage.get("auth_token")
+        return self.get("auth_token")
 
     def clear(self) -> None:
-        self._storage.remove("auth_token")
\ No newline at end of file
+        self.remove("auth_token")
+
+    # ─────────────────────────────
+    # INTERNO
+    # ─────────────────────────────
+
+    def _values(self) -> dict[str, Any]:
+        if self._cache is None:
+            self.hydrate()
+        return self._cache
+
+    def _read(self) -> dict[str, Any]:
+        raw = self._storage.get(self.NAMESPACE)
+        try:
+            data = json.loads(raw) if isinstance(raw, str) else raw
+        except ValueError:
+            data = None
+        return data if isinstance(data, dict) else {}
+
+    def _flush(self) -> None:
+        with self._io_lock:
+            # As alterações são tiradas já com o I/O serializado: a última
+            # gravação sempre leva os valores mais recentes
+            with self._lock:
+                if self._batch_depth > 0 or not self._pending:
+                    return
+                pending, self._pending = self._pending, {}
+
+            stored = self._read()
+            for key, value in pending.items():
+                if value is _MISSING:
+                    stored.pop(key, None)
+                else:
+                    stored[key] = value
+            self._storage.set(self.NAMESPACE, json.dumps(stored))
+            self._merge(stored)
+
+    def _merge(self, stored: dict[str, Any]) -> None:
+        # O namespace relido vira o cache; escritas locais ainda não gravadas prevalecem
+        with self._lock:
+            cache = dict(stored)
+            for key, value in self._pending.items():
+                if value is _MISSING:
+                    cache.pop(key, None)
+                else:
+                    cache[key] = value
+            self._cache = cache
+
+
+def get_storage(page: ft.Page) -> StorageService:
+    """StorageService da sessão, hidratado na primeira chamada."""
+    storage = getattr(page, "storage_service", None)
+    if storage is None:
+        storage = StorageService(page)
+        storage.hydrate()
+        page.storage_service = storage
+    return storage
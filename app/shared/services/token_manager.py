@@ -0,0 +1,153 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+
+import flet as ft
+
+from app.shared.services.http_client import HttpClient, get_http_client
+from app.shared.services.storange_service import StorageService, get_storage
+
+
+def decode_token_expiry(token: str | None) -> float | None:
+    """Lê o claim `exp` de um JWT sem validar a assinatura (só para agendar o refresh)."""
+    if not token or token.count(".") != 2:
+        return None
+    payload = token.split(".")[1]
+    try:
+        data = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except ValueError:
+        return None
+    exp = data.get("exp") if isinstance(data, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+class TokenManager:
+    REFRESH_PATH = "/auth/refresh"
+    # Intervalo mínimo entre refreshes (timer e novas tentativas após falha)
+    MIN_REFRESH_DELAY = 5.0
+
+    def __init__(self, http: HttpClient, storage: StorageService, *, refresh_margin: float = 60.0):
+        self._http = http
+        self._storage = storage
+        self.refresh_margin = refresh_margin
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        # `exp` de um refresh que não avançou a validade: não adianta tentar de novo
+        self._stalled_expiry: float | None = None
+        self._retry_at = 0.0
+
+        http.token_manager = self
+        self._schedule_refresh()
+
+    @property
+    def token(self) -> str | None:
+        return self._storage.get_token()
+
+    @property
+    def expires_at(self) -> float | None:
+        return decode_token_expiry(self.token)
+
+    def authorization_header(self) -> dict:
+        token = self.token
+        return {"Authorization": f"Bearer {token}"} if token else {}
+
+    def set_token(self, token: str | None) -> None:
+        if not token:
+            self.clear()
+            return
+        self._stalled_expiry = None
+        self._retry_at = 0.0
+        self._storage.set_token(token)
+        self._schedule_refresh()
+
+    async def set_token_async(self, token: str | None) -> None:
+        # A gravação no client_storage bloqueia: fora do loop do Flet
+        await asyncio.to_thread(self.set_token, token)
+
+    def clear(self) -> None:
+        self._cancel_timer()
+        self._storage.clear()
+
+    # ─────────────────────────────
+    # REFRESH
+    # ─────────────────────────────
+
+    def needs_refresh(self) -> bool:
+        expires_at = self.expires_at
+        return (
+            expires_at is not None
+            and expires_at != self._stalled_expiry
+            and time.time() >= self._retry_at
+            and expires_at - time.time() <= self.refresh_margin
+        )
+
+    def ensure_fresh(self) -> None:
+        if not self.needs_refresh():
+            return
+
+        # Um único refresh por vez: quem chega depois só reaproveita o token novo
+        with self._lock:
+            if not self.needs_refresh():
+                return
+            self._refresh_locked()
+
+    async def ensure_fresh_async(self) -> None:
+        if self.needs_refresh():
+            await asyncio.to_thread(self.ensure_fresh)
+
+    def _refresh_locked(self) -> None:
+        token = self.token
+        previous_expiry = self.expires_at
+        try:
+            response = self._http.post(self.REFRESH_PATH, json={"token": token})
+        except Exception:
+            # Token recusado ou backend fora: a próxima chamada recebe 401 e a UI trata
+            if self.expires_at is not None and self.expires_at <= time.time():
+                self.clear()
+                return
+            self._retry_at = time.time() + self.MIN_REFRESH_DELAY
+            self._schedule_refresh()
+            return
+
+        new_token = response.get("token")
+        new_expiry = decode_token_expiry(new_token)
+        if new_token and (new_expiry is None or (previous_expiry is not None and new_expiry <= previous_expiry)):
+            # Refresh não estendeu a validade: guarda o token e para de renovar
+            self._storage.set_token(new_token)
+            self._stalled_expiry = new_expiry
+            self._cancel_timer()
+            return
+
+        self.set_token(new_token)
+        # Token novo ainda dentro da margem (TTL curto): não renova de novo em seguida
+        self._retry_at = time.time() + self.MIN_REFRESH_DELAY
+
+    def _schedule_refresh(self) -> None:
+        self._cancel_timer()
+        expires_at = self.expires_at
+        if expires_at is None or expires_at == self._stalled_expiry:
+            return
+
+        # Token já dentro da margem não dispara refresh em laço: respeita o mínimo
+        delay = max(self.MIN_REFRESH_DELAY, expires_at - self.refresh_margin - time.time())
+        self._timer = threading.Timer(delay, self.ensure_fresh)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def close(self) -> None:
+        self._cancel_timer()
+
+
+def get_token_manager(page: ft.Page) -> TokenManager:
+    manager = getattr(page, "token_manager", None)
+    if manager is None:
+        manager = TokenManager(get_http_client(page), get_storage(page))
+        page.token_manager = manager
+    return manager
@@ -0,0 +1,74 @@
+"""Benchmark: validação de CPF/CNPJ em lote (NumPy) x validador unitário.
+
+Uso (na raiz do projeto, com o extra `numpy` instalado):
+    python -m benchmarks.document_batch_bench [quantidade]
+"""
+import random
+import sys
+import time
+
+from app.modules.auth.domain import document_batch
+from app.modules.auth.domain.auth_validations import AuthValidations
+
+DEFAULT_COUNT = 1_000_000
+# Uma parte dos documentos usa dígitos de largura total: a paridade com o
+# validador unitário também vale para dígitos decimais não ASCII
+FULLWIDTH = str.maketrans("0123456789", "０１２３４５６７８９")
+
+
+def maybe_fullwidth(rng: random.Random, document: str) -> str:
+    return document.translate(FULLWIDTH) if rng.random() < 0.01 else document
+
+
+def make_cpf(rng: random.Random) -> str:
+    digits = [rng.randint(0, 9) for _ in range(9)]
+    for size in (9, 10):
+        total = sum(d * w for d, w in zip(digits, range(size + 1, 1, -1)))
+        digits.append(document_batch._cpf_digit(total))
+    if rng.random() < 0.3:
+        digits[-1] = (digits[-1] + 1) % 10
+    cpf = "".join(map(str, digits))
+    cpf = f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}" if rng.random() < 0.5 else cpf
+    return maybe_fullwidth(rng, cpf)
+
+
+def make_cnpj(rng: random.Random) -> str:
+    digits = [rng.randint(0, 9) for _ in range(12)]
+    for weights in (document_batch.CNPJ_WEIGHTS_1, document_batch.CNPJ_WEIGHTS_2):
+        digits.append(document_batch._cnpj_digit(sum(d * w for d, w in zip(digits, weights))))
+    if rng.random() < 0.3:
+        digits[-1] = (digits[-1] + 1) % 10
+    return maybe_fullwidth(rng, "".join(map(str, digits)))
+
+
+def timed(label: str, fn, documents) -> list[bool]:
+    start = time.perf_counter()
+    valid = list(fn(documents))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.3f} s  ({len(documents) / elapsed / 1e6:6.2f} M docs/s)")
+    return valid
+
+
+def compare(kind: str, documents: list[str], scalar, batch) -> None:
+    print(f"\n# {kind}: {len(documents):,} documentos")
+    expected = timed("unitário (laço Python)", lambda docs: [scalar(d) for d in docs], documents)
+    got = timed("lote (NumPy)", lambda docs: batch(docs).valid, documents)
+    assert got == expected, "resultados divergentes"
+
+
+def main() -> None:
+    if document_batch.np is None:
+        sys.exit("NumPy não instalado: instale o extra `numpy` para rodar o benchmark.")
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    rng = random.Random(42)
+
+    cpfs = [make_cpf(rng) for _ in range(count)]
+    compare("CPF", cpfs, AuthValidations.validate_cpf, AuthValidations.validate_cpf_batch)
+
+    cnpjs = [make_cnpj(rng) for _ in range(count)]
+    compare("CNPJ", cnpjs, AuthValidations.validate_cnpj, AuthValidations.validate_cnpj_batch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Micro-benchmark: avaliador de regras de senha em passada única x regex antigos.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.password_rules_bench
+"""
+import random
+import re
+import string
+import timeit
+
+from app.modules.auth.domain import password_rules
+from app.modules.auth.domain.auth_validations import AuthValidations
+from app.core.utils.validators import PASSWORD_MAX_LEN, PASSWORD_MIN_LEN
+
+NUMBER = 20_000
+
+
+# Implementação anterior: um re.search por regra + any() no card
+def legacy_strength(password: str) -> bool:
+    return (
+        PASSWORD_MIN_LEN <= len(password) <= PASSWORD_MAX_LEN
+        and bool(re.search(r"[A-Z]", password))
+        and bool(re.search(r"[a-z]", password))
+        and bool(re.search(r"\d", password))
+        and bool(re.search(r"[^\w\s]", password))
+    )
+
+
+def legacy_card(password: str) -> list[bool]:
+    return [
+        PASSWORD_MIN_LEN <= len(password) <= PASSWORD_MAX_LEN,
+        any(c.isupper() for c in password),
+        any(c.islower() for c in password),
+        bool(re.search(r"\d", password)),
+        bool(re.search(r"[^\w\s]", password)),
+    ]
+
+
+# Como no app: o card e o controller têm cada um o seu avaliador (memo por instância)
+card_rules = password_rules.PasswordRuleEvaluator()
+controller_rules = password_rules.PasswordRuleEvaluator()
+
+
+def new_card(password: str) -> int:
+    return card_rules.evaluate(password).mask
+
+
+def new_strength(password: str) -> bool:
+    return AuthValidations.validate_password_strength(password, evaluate=controller_rules.evaluate).is_valid
+
+
+def sample_passwords(count: int = 1_000, *, accents: bool = False) -> list[str]:
+    rng = random.Random(42)
+    alphabet = string.ascii_letters + string.digits + "@!$&# _-" + ("çÉã" if accents else "")
+    return ["".join(rng.choices(alphabet, k=rng.randint(0, 24))) for _ in range(count)]
+
+
+def check_equivalence(passwords: list[str]) -> None:
+    for password in passwords:
+        result = password_rules._scan(password)
+        assert result.is_strong == legacy_strength(password), password
+
+
+def bench(label: str, fn, passwords: list[str]) -> None:
+    total = len(passwords)
+
+    def run():
+        for password in passwords:
+            fn(password)
+
+    seconds = min(timeit.repeat(run, number=max(1, NUMBER // total), repeat=5))
+    calls = total * max(1, NUMBER // total)
+    print(f"{label:<40} {seconds / calls * 1e6:8.3f} µs/chamada")
+
+
+def main() -> None:
+    for accents in (False, True):
+        passwords = sample_passwords(accents=accents)
+        check_equivalence(passwords)
+
+        print(f"\n# senhas {'com' if accents else 'sem'} acentos")
+        bench("regras: regex (antigo)", legacy_strength, passwords)
+        bench("regras: passada única", password_rules.evaluate_password, passwords)
+        bench("tecla: card (antigo)", legacy_card, passwords)
+        bench("tecla: card (novo)", new_card, passwords)
+        bench("submit: validador (novo)", new_strength, passwords)
+
+
+if __name__ == "__main__":
+    main()
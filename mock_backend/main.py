@@ -1,15 +1,106 @@
+import base64
+import gzip
+import hashlib
+import json
 import time
 from typing import Optional
-from fastapi import Body, FastAPI, HTTPException, status
+from fastapi import Body, FastAPI, Header, HTTPException, Request, status
 from pydantic import BaseModel
 from uuid import uuid4
 from datetime import datetime, timedelta
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 
+
+# Várias instâncias para testar o balanceamento do frontend:
+#   uvicorn mock_backend.main:app --port 8000
+#   uvicorn mock_backend.main:app --port 8001
+#   VIMI42_API_URLS=http://127.0.0.1:8000,http://127.0.0.1:8001 python main.py
 app = FastAPI(title="Mock Auth Backend")
 
+
+# ─────────────────────────────
+# Compressão (Content-Encoding na requisição / Accept-Encoding na resposta)
+# ─────────────────────────────
+
+class RequestDecompressionMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        headers = dict(scope["headers"])
+        encoding = headers.get(b"content-encoding", b"").decode().lower()
+        if encoding not in ("gzip", "br"):
+            return await self.app(scope, receive, send)
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif brotli is not None:
+            body = brotli.decompress(body)
+        else:
+            response = JSONResponse(status_code=415, content={"detail": "br não suportado"})
+            return await response(scope, receive, send)
+
+        scope["headers"] = [
+            (k, v) for k, v in scope["headers"]
+            if k not in (b"content-encoding", b"content-length")
+        ] + [(b"content-length", str(len(body)).encode())]
+
+        async def receive_decompressed():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(scope, receive_decompressed, send)
+
+
+app.add_middleware(RequestDecompressionMiddleware)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+# ─────────────────────────────
+# ETag (GET condicional)
+# ─────────────────────────────
+
+@app.middleware("http")
+async def etag_middleware(request: Request, call_next):
+    response = await call_next(request)
+    if request.method != "GET" or response.status_code != 200:
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+    headers = {
+        k: v for k, v in response.headers.items()
+        if k.lower() not in ("content-length", "etag")
+    }
+    headers["ETag"] = etag
+    headers.setdefault("Cache-Control", "max-age=10")
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=body,
+        status_code=response.status_code,
+        headers=headers,
+        media_type=response.media_type,
+    )
+
 # ─────────────────────────────
 # Models
 # ─────────────────────────────
@@ -65,12 +156,76 @@ PASSWORD_RESET = {
     "reset_session": None,
 }
 
+# ─────────────────────────────
+# Token (JWT sem assinatura, só para o frontend ler o `exp`)
+# ─────────────────────────────
+
+TOKEN_TTL = timedelta(minutes=15)
+
+
+def _b64(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+
+def issue_token(email: str) -> str:
+    # `exp` em epoch UTC: time.time() não depende do fuso do servidor
+    exp = int(time.time() + TOKEN_TTL.total_seconds())
+    return f'{_b64({"alg": "none", "typ": "JWT"})}.{_b64({"sub": email, "exp": exp})}.fake'
+
+
+def read_token(token: str) -> Optional[dict]:
+    try:
+        payload = token.split(".")[1]
+        data = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return None
+    if data.get("exp", 0) < time.time():
+        return None
+    return data
+
+# ─────────────────────────────
+# Idempotency-Key (respostas reaproveitadas por 60s)
+# ─────────────────────────────
+
+IDEMPOTENCY_TTL = timedelta(seconds=60)
+IDEMPOTENCY_CACHE: dict[str, tuple[datetime, dict]] = {}
+
+
+def get_idempotent_response(path: str, key: Optional[str]) -> Optional[dict]:
+    if not key:
+        return None
+    cached = IDEMPOTENCY_CACHE.get(f"{path}:{key}")
+    if cached and cached[0] > datetime.utcnow():
+        print(f"[MOCK BACKEND] Requisição repetida ignorada ({path})")
+        return cached[1]
+    return None
+
+
+def store_idempotent_response(path: str, key: Optional[str], response: dict) -> dict:
+    if key:
+        IDEMPOTENCY_CACHE[f"{path}:{key}"] = (datetime.utcnow() + IDEMPOTENCY_TTL, response)
+    return response
+
 # ─────────────────────────────
 # Routes
 # ─────────────────────────────
 
+@app.get("/health")
+def health():
+    return {"status": "ok"}
+
+
+@app.get("/profile")
+def profile():
+    return {"email": FAKE_USER["email"], "name": "Usuário Fake"}
+
+
 @app.post("/auth/register")
-def register(data: dict):
+def register(data: dict, idempotency_key: Optional[str] = Header(None)):
+    cached = get_idempotent_response("/auth/register", idempotency_key)
+    if cached:
+        return cached
+
     email = data.get("email")
     person_type = data.get("person_type")
     
@@ -92,7 +247,11 @@ def register(data: dict):
     
     print(f"[MOCK BACKEND] Cadastro Recebido: {data}")
     USERS_DB.append(data)
-    return {"success": True, "message": "Usuário criado com sucesso"}
+    return store_idempotent_response(
+        "/auth/register",
+        idempotency_key,
+        {"success": True, "message": "Usuário criado com sucesso"},
+    )
 
 @app.post("/auth/complete-registration")
 def complete_registration(data: dict = Body(...)):
@@ -126,13 +285,24 @@ def login(data: dict): # Simplificado para aceitar dict
     if email == FAKE_USER["email"] and password == FAKE_USER["password"]:
         return {
             "success": True,
-            "token": "jwt-fake-token",
+            "token": issue_token(email),
             "user": {"email": email, "name": "Usuário Fake"}
         }
     raise HTTPException(status_code=401, detail="Credenciais inválidas")
 
+@app.post("/auth/refresh")
+def refresh(data: dict):
+    claims = read_token(data.get("token") or "")
+    if not claims:
+        raise HTTPException(status_code=401, detail="Token inválido ou expirado")
+    return {"success": True, "token": issue_token(claims["sub"])}
+
 @app.post("/auth/forgot-password")
-def forgot_password(payload: dict):
+def forgot_password(payload: dict, idempotency_key: Optional[str] = Header(None)):
+    cached = get_idempotent_response("/auth/forgot-password", idempotency_key)
+    if cached:
+        return cached
+
     email = payload.get("email")
 
     if not email:
@@ -151,10 +321,14 @@ def forgot_password(payload: dict):
 
     return JSONResponse(
         status_code=200,
-        content={
-            "success": True,
-            "message": "Token enviado com sucesso"
-        }
+        content=store_idempotent_response(
+            "/auth/forgot-password",
+            idempotency_key,
+            {
+                "success": True,
+                "message": "Token enviado com sucesso"
+            },
+        ),
     )
 
 